@@ -1,18 +1,23 @@
 """Pretty-print tabular data."""
 
-from collections import namedtuple
-from collections.abc import Callable, Iterable, Sized
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, deque, namedtuple
+from collections.abc import Callable, Iterable, Sequence, Sized
+from concurrent.futures import Executor, ProcessPoolExecutor
 import dataclasses
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from decimal import Decimal
-from functools import partial, reduce
+from functools import lru_cache, partial, reduce
 from html import escape as htmlescape
 from importlib.metadata import PackageNotFoundError, version
 import io
-from itertools import chain, zip_longest as izip_longest
+from itertools import chain, count, islice, repeat, zip_longest as izip_longest
 import math
+import operator
+import pickle
 import re
 import textwrap
+import threading
 import warnings
 
 try:
@@ -29,7 +34,19 @@ except PackageNotFoundError:
         __version__ = "unknown"
 
 
-__all__ = ["tabulate", "tabulate_formats", "simple_separated_format"]
+__all__ = [
+    "tabulate",
+    "tabulate_iter",
+    "write_table",
+    "paginate",
+    "Table",
+    "tabulate_formats",
+    "simple_separated_format",
+    "type_cache_info",
+    "type_cache_clear",
+    "width_cache_info",
+    "width_cache_clear",
+]
 
 # minimum extra space in headers
 MIN_PADDING = 2
@@ -37,6 +54,35 @@ MIN_PADDING = 2
 # Whether or not to preserve leading/trailing whitespace in data.
 PRESERVE_WHITESPACE = False
 
+# Maximal number of distinct string values per column whose deduced types are
+# remembered while deducing the column type (0 to disable the cache).
+TYPE_CACHE_SIZE = 1024
+
+# Maximal number of visible widths of strings remembered across tables
+# (0 to disable the cache).
+WIDTH_CACHE_SIZE = 0
+
+# Number of lines write_table() renders before writing them to the file.
+_WRITE_BATCH_SIZE = 1000
+
+# Number of rows tabulate_iter() reads to choose the layout of a table of unknown length.
+_STREAM_SAMPLE_SIZE = 100
+
+# Number of render plans (see _render_plan()) kept for reuse by the following tables.
+_RENDER_PLAN_CACHE_SIZE = 64
+
+# Minimal number of cells of a table whose columns tabulate(..., workers=N)
+# processes in worker processes (smaller tables are processed serially).
+_PARALLEL_MIN_CELLS = 100000
+
+# Number of rows rendered by one job when tabulate(..., workers=N) renders
+# the rows of a table in worker processes.
+_RENDER_CHUNK_SIZE = 10000
+
+# Number of values per block of a column for which the results of a column
+# step are kept between the renderings of a `Table` (see `_ColumnCache.fold`).
+_COLUMN_BLOCK_SIZE = 1000
+
 # TextWrapper breaks words longer than 'width'.
 _BREAK_LONG_WORDS = True
 # TextWrapper is breaking hyphenated words.
@@ -49,6 +95,8 @@ _DEFAULT_MISSINGVAL = ""
 # default align will be overwritten by "left", "center" or "decimal"
 # depending on the formatter
 _DEFAULT_ALIGN = "default"
+# the cells of the row which replaces the elided rows (see `max_rows` of `tabulate`)
+_ELLIPSIS = "..."
 
 
 # if True, enable wide-character (CJK) support
@@ -67,6 +115,38 @@ class DataRow:
     sep: str
     end: str
     escape_map: dict = None
+    _escape: tuple = field(default=None, init=False, repr=False, compare=False)
+
+    def _escaper(self):
+        """Return a function which escapes a cell according to `escape_map`.
+
+        The function is compiled once and recompiled only if `escape_map` changes.
+
+        """
+        escape_map = self.escape_map
+        if self._escape is None or self._escape[0] != escape_map:
+            self._escape = (dict(escape_map), _compile_escape_map(escape_map))
+        return self._escape[1]
+
+
+def _compile_escape_map(escape_map):
+    """Return a function which replaces the keys of `escape_map` in a string.
+
+    >>> _compile_escape_map({"&": "&amp;", "<": "&lt;"})("a<b & c")
+    'a&lt;b &amp; c'
+    >>> _compile_escape_map({"<br>": " ", "<": "&lt;"})("a<br>b<c")
+    'a b&lt;c'
+
+    """
+    escape_map = {k: v for k, v in escape_map.items() if k}
+    if all(len(k) == 1 for k in escape_map):
+        table = str.maketrans(escape_map)
+        return lambda cell: cell.translate(table)
+    else:
+        # the longest keys first, so that they are not shadowed by their prefixes
+        keys = sorted(escape_map, key=len, reverse=True)
+        pattern = re.compile("|".join(map(re.escape, keys)))
+        return partial(pattern.sub, lambda match: escape_map[match.group()])
 
 
 # A table structure is supposed to be:
@@ -330,7 +410,7 @@ _latex_row = DataRow("", "&", "\\\\", LATEX_ESCAPE_RULES)
 GITHUB_ESCAPE_RULES = {r"|": r"\|"}
 
 
-def _rst_escape_first_column(rows, headers):
+def _rst_escape_first_column(cols, headers):
     def escape_empty(val):
         if isinstance(val, (str, bytes)) and not val.strip():
             return ".."
@@ -338,15 +418,12 @@ def _rst_escape_first_column(rows, headers):
             return val
 
     new_headers = list(headers)
-    new_rows = []
+    new_cols = list(cols)
     if headers:
         new_headers[0] = escape_empty(headers[0])
-    for row in rows:
-        new_row = list(row)
-        if new_row:
-            new_row[0] = escape_empty(row[0])
-        new_rows.append(new_row)
-    return new_rows, new_headers
+    if new_cols:
+        new_cols[0] = [escape_empty(val) for val in cols[0]]
+    return new_cols, new_headers
 
 
 _table_formats = {
@@ -756,6 +833,8 @@ multiline_formats = {
 
 _multiline_codes = re.compile(r"\r|\n|\r\n")
 _multiline_codes_bytes = re.compile(b"\r|\n|\r\n")
+# all line boundaries of str.splitlines(), multiline cells are split on them
+_line_boundaries = re.compile("[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
 
 # Handle ANSI escape sequences for both control sequence introducer (CSI) and
 # operating system command (OSC). Both of these begin with 0x1b (or octal 033),
@@ -811,6 +890,24 @@ _float_with_thousands_separators = re.compile(
     r"^(([+-]?[0-9]{1,3})(?:,([0-9]{3}))*)?(?(1)\.[0-9]*|\.[0-9]+)?$"
 )
 
+# common forms of numbers and booleans in strings, see _classify_string();
+# ints and floats are certainly converted to int and to finite floats,
+# no matter what sys.get_int_max_str_digits() is
+_number_string = re.compile(
+    r"""
+    (?P<int>[+-]?[0-9]{1,640})
+    | (?P<float>[+-]?([0-9]{1,200}(\.[0-9]*)?|\.[0-9]+)([eE][+-]?[0-9]{1,2})?)
+    | (?P<thousands_int>[+-]?[0-9]{1,3}(,[0-9]{3})+)
+    | (?P<thousands_float>[+-]?[0-9]{1,3}(,[0-9]{3})+\.[0-9]*)
+    | (?P<bool>True|False)
+    """,
+    re.VERBOSE,
+)
+
+# format specs which give the same result with format() and printf-style % formatting
+_printf_float_format = re.compile(r"[+ ]?#?0?[0-9]*(\.[0-9]+)?[eEfFgG]")
+_printf_int_format = re.compile(r"[+ ]?#?0?[0-9]*[doxX]")
+
 
 def simple_separated_format(separator):
     """Construct a simple TableFormat with columns separated by a separator.
@@ -832,6 +929,52 @@ def simple_separated_format(separator):
     )
 
 
+@lru_cache(maxsize=4096)
+def _classify_string(string):
+    """Classify a string as one of the common forms of numbers or booleans.
+
+    Return the kind of the string ("int", "float", "thousands_int",
+    "thousands_float" or "bool") and the number of symbols after its decimal
+    point (as `_afterpoint` counts them), or None if the string is of none of
+    these forms. Such strings (with spaces, ANSI codes, "inf", "nan", etc.)
+    are classified by `_isbool`, `_isint`, `_isnumber` and
+    `_isnumber_with_thousands_separator`.
+
+    The result is cached, so type deduction, formatting and decimal alignment
+    of the same string parse it only once.
+
+    >>> _classify_string("-42")
+    ('int', -1)
+    >>> _classify_string("1,234.5")
+    ('thousands_float', 1)
+    >>> _classify_string("1.5e10")
+    ('float', 4)
+    >>> _classify_string(" 42") is None
+    True
+
+    """
+    match = _number_string.fullmatch(string)
+    if match is None:
+        return None
+    kind = match.lastgroup
+    if kind in ("float", "thousands_float"):
+        pos = string.rfind(".")
+        pos = string.lower().rfind("e") if pos < 0 else pos
+        return kind, (len(string) - pos - 1 if pos >= 0 else -1)
+    else:
+        return kind, -1
+
+
+# types of the kinds of strings returned by _classify_string()
+_string_kind_types = {
+    "int": int,
+    "thousands_int": int,
+    "float": float,
+    "thousands_float": float,
+    "bool": bool,
+}
+
+
 def _isnumber_with_thousands_separator(string):
     """
     >>> _isnumber_with_thousands_separator(".")
@@ -979,6 +1122,13 @@ def _type(string, has_invisible=True, numparse=True):
 
     """
 
+    if isinstance(string, str) and string:
+        # common forms of numbers, they have no ANSI codes to strip
+        classified = _classify_string(string)
+        if classified is not None:
+            valtype = _string_kind_types[classified[0]]
+            return valtype if numparse or valtype is bool else str
+
     if has_invisible and isinstance(string, (str, bytes)):
         string = _strip_ansi(string)
 
@@ -1023,6 +1173,9 @@ def _afterpoint(string):
     2
 
     """
+    classified = _classify_string(string) if isinstance(string, str) else None
+    if classified is not None:
+        return classified[1]
     if _isnumber(string) or _isnumber_with_thousands_separator(string):
         if _isint(string):
             return -1
@@ -1109,11 +1262,11 @@ def _visible_width(s):
             return wcwidth.width(str(s))
         # while previous versions need them stripped first.
         if isinstance(s, (str, bytes)):
-            return wcwidth.wcswidth(_strip_ansi(str(s)))
+            return _wcswidth(_strip_ansi(str(s)))
 
         # Otherwise, coerce to string, guaranteed to be without any control codes,
         # we can use wcswidth() directly.
-        return wcwidth.wcswidth(str(s))
+        return _wcswidth(str(s))
     if isinstance(s, (str, bytes)):
         return len(_strip_ansi(s))
     else:
@@ -1127,6 +1280,120 @@ def _is_multiline(s):
         return bool(re.search(_multiline_codes_bytes, s))
 
 
+def _scan_column(strings, multiline=True, chunk_size=1000):
+    """Return if any of the strings has ANSI codes and if any has line breaks.
+
+    The strings are joined and scanned in chunks, the scan stops as soon as
+    both are found. Line breaks are looked for only if `multiline` is true.
+
+    >>> _scan_column(["a", "\\x1b[31mb\\x1b[0m", "c"])
+    (True, False)
+    >>> _scan_column(["a", "b\\nc"], multiline=False)
+    (False, False)
+
+    """
+    has_invisible = is_multiline = False
+    strings = iter(strings)
+    while not (has_invisible and (is_multiline or not multiline)):
+        chunk = list(islice(strings, chunk_size))
+        if not chunk:
+            break
+        text = "\t".join(map(_to_str, chunk))
+        has_invisible = has_invisible or ("\x1b" in text and _ansi_codes.search(text) is not None)
+        is_multiline = is_multiline or (multiline and _line_boundaries.search(text) is not None)
+    return has_invisible, is_multiline
+
+
+def _is_printable_ascii(strings, chunk_size=1000):
+    """Return if all the strings consist of printable ASCII characters only,
+    so that their visible widths are their lengths.
+
+    The strings are joined and checked in chunks (see `_scan_column`), the
+    check stops at the first chunk with other characters.
+
+    >>> _is_printable_ascii(["abc", "1.5"]), _is_printable_ascii(["abc", "\u4e2d"])
+    (True, False)
+
+    """
+    strings = iter(strings)
+    while True:
+        chunk = list(islice(strings, chunk_size))
+        if not chunk:
+            return True
+        text = "".join(map(_to_str, chunk))
+        if not (text.isascii() and text.isprintable()):
+            return False
+
+
+def _wcswidth(s):
+    """Visible width of a string with wide characters, but without ANSI codes.
+
+    Printable ASCII strings are measured without calling wcwidth.
+
+    """
+    if s.isascii() and s.isprintable():
+        return len(s)
+    return wcwidth.wcswidth(s)
+
+
+_WidthCacheInfo = namedtuple("WidthCacheInfo", ["hits", "misses", "maxsize", "currsize"])
+_width_cache = OrderedDict()
+_width_cache_lock = threading.Lock()
+_width_cache_hits = 0
+_width_cache_misses = 0
+
+
+def _cached_width(width_fn, s):
+    """Return `width_fn(s)`, remembered in the least recently used cache
+    of up to `WIDTH_CACHE_SIZE` widths."""
+    global _width_cache_hits, _width_cache_misses
+    key = (s, width_fn, WIDE_CHARS_MODE)
+    try:
+        with _width_cache_lock:
+            width = _width_cache[key]
+            _width_cache.move_to_end(key)
+            _width_cache_hits += 1
+        return width
+    except KeyError:
+        pass
+    except TypeError:  # unhashable
+        return width_fn(s)
+    width = width_fn(s)
+    with _width_cache_lock:
+        _width_cache_misses += 1
+        _width_cache[key] = width
+        while len(_width_cache) > max(WIDTH_CACHE_SIZE, 0):
+            _width_cache.popitem(last=False)
+    return width
+
+
+def width_cache_info():
+    """Statistics of the cache of visible widths of strings.
+
+    If `WIDTH_CACHE_SIZE` is positive, visible widths of up to `WIDTH_CACHE_SIZE`
+    strings with ANSI codes or wide characters are remembered across tables.
+    Return a named tuple of the total number of cache hits and misses since the
+    module was imported (or since `width_cache_clear` was called), the maximal
+    and the current cache size.
+
+    >>> width_cache_info().currsize
+    0
+
+    """
+    return _WidthCacheInfo(
+        _width_cache_hits, _width_cache_misses, WIDTH_CACHE_SIZE, len(_width_cache)
+    )
+
+
+def width_cache_clear():
+    "Empty the cache of visible widths and reset its statistics, see `width_cache_info`."
+    global _width_cache_hits, _width_cache_misses
+    with _width_cache_lock:
+        _width_cache.clear()
+        _width_cache_hits = 0
+        _width_cache_misses = 0
+
+
 def _multiline_width(multiline_s, line_width_fn=len):
     """Visible width of a potentially multiline content."""
     return max(map(line_width_fn, re.split("[\r\n]", multiline_s)))
@@ -1137,9 +1404,11 @@ def _choose_width_fn(has_invisible, enable_widechars, is_multiline):
     if has_invisible:
         line_width_fn = _visible_width
     elif enable_widechars:  # optional wide-character support if available
-        line_width_fn = wcwidth.wcswidth
+        line_width_fn = _wcswidth
     else:
         line_width_fn = len
+    if WIDTH_CACHE_SIZE > 0 and line_width_fn is not len:
+        line_width_fn = partial(_cached_width, line_width_fn)
     if is_multiline:
         width_fn = lambda s: _multiline_width(s, line_width_fn)  # noqa: E731
     else:
@@ -1147,7 +1416,10 @@ def _choose_width_fn(has_invisible, enable_widechars, is_multiline):
     return width_fn
 
 
-def _align_column_choose_padfn(strings, alignment, has_invisible, preserve_whitespace):
+def _align_column_choose_padfn(
+    strings, alignment, has_invisible, preserve_whitespace, mindecimals=-1
+):
+    maxdecimals = -1
     if alignment == "right":
         if not preserve_whitespace:
             strings = [s.strip() for s in strings]
@@ -1161,7 +1433,7 @@ def _align_column_choose_padfn(strings, alignment, has_invisible, preserve_white
             decimals = [_afterpoint(_strip_ansi(s)) for s in strings]
         else:
             decimals = [_afterpoint(s) for s in strings]
-        maxdecimals = max(decimals)
+        maxdecimals = max(max(decimals), mindecimals)
         strings = [s + (maxdecimals - decs) * " " for s, decs in zip(strings, decimals)]
         padfn = _padleft
     elif not alignment:
@@ -1170,16 +1442,18 @@ def _align_column_choose_padfn(strings, alignment, has_invisible, preserve_white
         if not preserve_whitespace:
             strings = [s.strip() for s in strings]
         padfn = _padright
-    return strings, padfn
+    return strings, padfn, maxdecimals
 
 
 def _align_column_choose_width_fn(has_invisible, enable_widechars, is_multiline):
     if has_invisible:
         line_width_fn = _visible_width
     elif enable_widechars:  # optional wide-character support if available
-        line_width_fn = wcwidth.wcswidth
+        line_width_fn = _wcswidth
     else:
         line_width_fn = len
+    if WIDTH_CACHE_SIZE > 0 and line_width_fn is not len:
+        line_width_fn = partial(_cached_width, line_width_fn)
     if is_multiline:
         width_fn = lambda s: _align_column_multiline_width(  # noqa: E731
             s, line_width_fn
@@ -1214,8 +1488,32 @@ def _align_column(
     preserve_whitespace=False,
 ):
     """[string] -> [padded_string]"""
-    strings, padfn = _align_column_choose_padfn(
-        strings, alignment, has_invisible, preserve_whitespace
+    return _align_column_measured(
+        strings,
+        alignment,
+        minwidth,
+        has_invisible,
+        enable_widechars,
+        is_multiline,
+        preserve_whitespace,
+    )[0]
+
+
+def _align_column_measured(
+    strings,
+    alignment,
+    minwidth=0,
+    has_invisible=True,
+    enable_widechars=False,
+    is_multiline=False,
+    preserve_whitespace=False,
+    mindecimals=-1,
+):
+    """Align a column like `_align_column`, with at least `mindecimals` digits after
+    the decimal point for decimal alignment. Return the padded strings, the width
+    they were padded to and the number of digits after the decimal point (or -1)."""
+    strings, padfn, maxdecimals = _align_column_choose_padfn(
+        strings, alignment, has_invisible, preserve_whitespace, mindecimals
     )
     width_fn = _align_column_choose_width_fn(has_invisible, enable_widechars, is_multiline)
 
@@ -1249,7 +1547,39 @@ def _align_column(
             # wcswidth and _visible_width don't count invisible characters;
             # padfn doesn't need to apply another correction
             padded_strings = [padfn(w, s) for s, w in zip(strings, visible_widths)]
-    return padded_strings
+    return padded_strings, maxwidth, maxdecimals
+
+
+def _align_column_width(
+    strings, alignment, has_invisible, enable_widechars, is_multiline, preserve_whitespace
+):
+    """The width and the number of digits after the decimal point (or -1) of a
+    column aligned by `_align_column` with no minimal width, without aligning it.
+
+    >>> _align_column_width(["1.5", "12.25", "x"], "decimal", False, False, False, False)
+    (5, 2)
+
+    """
+    strings, _, maxdecimals = _align_column_choose_padfn(
+        strings, alignment, has_invisible, preserve_whitespace
+    )
+    width_fn = _align_column_choose_width_fn(has_invisible, enable_widechars, is_multiline)
+    return max(_flat_list(map(width_fn, strings))), maxdecimals
+
+
+def _combine_column_widths(widths1, widths2):
+    """Combine the results of `_align_column_width` for two parts of a column
+    of single-line values (decimal alignment pads the values with spaces).
+
+    >>> _combine_column_widths((6, 2), (4, 0))
+    (6, 2)
+    >>> _combine_column_widths((4, 0), (3, -1))
+    (4, 0)
+
+    """
+    (width1, decimals1), (width2, decimals2) = widths1, widths2
+    decimals = max(decimals1, decimals2)
+    return max(width1 + decimals - decimals1, width2 + decimals - decimals2), decimals
 
 
 def _more_generic(type1, type2):
@@ -1295,10 +1625,194 @@ def _column_type(strings, has_invisible=True, numparse=True):
     True
 
     """
-    types = [_type(s, has_invisible, numparse) for s in strings]
+    if numparse:
+        coltype = _numpy_column_type(strings)
+        if coltype is not None:
+            return coltype
+    global _type_cache_hits, _type_cache_misses
+    # columns often repeat a few distinct strings, remember their types
+    cache = {}
+    hits = 0
+    types = set()
+    for s in strings:
+        if type(s) is str or type(s) is bytes:
+            t = cache.get(s)
+            if t is not None:
+                hits += 1
+            else:
+                t = _type(s, has_invisible, numparse)
+                if len(cache) < TYPE_CACHE_SIZE:
+                    cache[s] = t
+                _type_cache_misses += 1
+        else:
+            t = _type(s, has_invisible, numparse)
+        types.add(t)
+    _type_cache_hits += hits
     return reduce(_more_generic, types, bool)
 
 
+def _column_type_sampled(strings, sample_size, has_invisible=True, numparse=True):
+    """The least generic type all column values are convertible to, deduced
+    from a sample of `sample_size` values and checked for the other values.
+
+    The result is the same as of `_column_type`. Only the values which do
+    not pass a fast check for the type deduced so far are inspected with
+    `_type`, and repeated strings are checked once (see `TYPE_CACHE_SIZE`).
+
+    >>> _column_type_sampled(["1", "2", "3", "4.5", "5"], 2) is float
+    True
+    >>> _column_type_sampled([1, 2, 3, None, "x"], 2) is str
+    True
+
+    """
+    nvalues = len(strings)
+    if nvalues <= sample_size or not numparse or _numpy_column_type(strings) is not None:
+        return _column_type(strings, has_invisible, numparse)
+    # the first values and evenly spaced values after them
+    head = (sample_size + 1) // 2
+    step = max(1, (nvalues - head) // (sample_size - head)) if sample_size > head else nvalues
+    sample = [
+        strings[i] for i in chain(range(head), range(head, nvalues, step)[: sample_size - head])
+    ]
+    coltype = _column_type(sample, has_invisible, numparse)
+    is_of_coltype = _type_checks.get(coltype)
+    global _type_cache_hits, _type_cache_misses
+    # strings which passed the check (they pass it for more generic types too)
+    checked = set()
+    hits = 0
+    for s in strings:
+        if is_of_coltype is None:
+            break  # str, there is no more generic type
+        is_str = type(s) is str or type(s) is bytes
+        if is_str:
+            if s in checked:
+                hits += 1
+                continue
+            _type_cache_misses += 1
+        if not is_of_coltype(s):
+            coltype = _more_generic(coltype, _type(s, has_invisible, numparse))
+            is_of_coltype = _type_checks.get(coltype)
+        elif is_str and len(checked) < TYPE_CACHE_SIZE:
+            checked.add(s)
+    _type_cache_hits += hits
+    return coltype
+
+
+def _is_none_type(s):
+    return s is None or ((type(s) is str or type(s) is bytes) and not s)
+
+
+def _is_bool_type(s):
+    return type(s) is bool or _is_none_type(s) or (type(s) is str and s in ("True", "False"))
+
+
+def _is_int_type(s):
+    return (
+        type(s) is int
+        or _is_bool_type(s)
+        or (type(s) is str and (_classify_string(s) or ("",))[0] in ("int", "thousands_int"))
+    )
+
+
+def _is_float_type(s):
+    return (
+        type(s) is float or _is_int_type(s) or (type(s) is str and _classify_string(s) is not None)
+    )
+
+
+def _is_bytes_type(s):
+    return type(s) is bytes or _is_float_type(s)
+
+
+# fast, but incomplete checks that _type(value) is of the given type or less generic
+_type_checks = {
+    type(None): _is_none_type,
+    bool: _is_bool_type,
+    int: _is_int_type,
+    float: _is_float_type,
+    bytes: _is_bytes_type,
+}
+
+
+_TypeCacheInfo = namedtuple("TypeCacheInfo", ["hits", "misses", "maxsize"])
+_type_cache_hits = 0
+_type_cache_misses = 0
+
+
+def type_cache_info():
+    """Statistics of the cache of deduced types of string values.
+
+    While deducing the type of a column, the types of up to `TYPE_CACHE_SIZE`
+    distinct strings (or bytes) of the column are remembered. Return a named
+    tuple of the total number of cache hits and misses since the module was
+    imported (or since `type_cache_clear` was called), and the cache size.
+
+    >>> type_cache_clear()
+    >>> _ = tabulate([["spam"], ["eggs"], ["spam"], ["spam"]])
+    >>> type_cache_info()
+    TypeCacheInfo(hits=2, misses=2, maxsize=1024)
+
+    """
+    return _TypeCacheInfo(_type_cache_hits, _type_cache_misses, TYPE_CACHE_SIZE)
+
+
+def type_cache_clear():
+    "Reset statistics of the cache of deduced types, see `type_cache_info`."
+    global _type_cache_hits, _type_cache_misses
+    _type_cache_hits = 0
+    _type_cache_misses = 0
+
+
+def _numpy_column_type(column):
+    """The type `_column_type` deduces for the values of a numeric 1D NumPy array,
+    or None if the column is not such an array.
+
+    The type is taken from the dtype of the array, values are not inspected.
+    NumPy integers are int, other numeric types (unsigned integers, booleans
+    and floats) are deduced to be float.
+
+    >>> _numpy_column_type([1, 2]) is None
+    True
+
+    """
+    if str(type(column)) != "<class 'numpy.ndarray'>" or column.ndim != 1:
+        return None  # not a plain NumPy array (masked arrays may have missing values)
+    kind = column.dtype.kind
+    if kind == "i":
+        return int
+    elif kind in "ufb":
+        return float
+    else:
+        return None
+
+
+def _format_column(values, valtype, floatfmt, intfmt, missingval="", has_invisible=True):
+    """Format all values of a column like `_format` does.
+
+    Numeric NumPy arrays are converted to Python numbers all at once and then
+    formatted without checking every value.
+
+    >>> _format_column([1, 22, None], int, "g", ",", "n/a")
+    ['1', '22', 'n/a']
+
+    """
+    if _numpy_column_type(values) is not None and (
+        valtype is float or (valtype is int and values.dtype.kind in "iu")
+    ):
+        if valtype is int:
+            values, fmt, printf_format = values.tolist(), intfmt, _printf_int_format
+        else:
+            values = values.astype(float, copy=False).tolist()
+            fmt, printf_format = floatfmt, _printf_float_format
+        if not fmt:
+            return list(map(str, values))
+        elif printf_format.fullmatch(fmt):
+            return list(map(f"%{fmt}".__mod__, values))
+        else:
+            return [format(v, fmt) for v in values]
+    return [_format(v, valtype, floatfmt, intfmt, missingval, has_invisible) for v in values]
+
+
 def _format(val, valtype, floatfmt, intfmt, missingval="", has_invisible=True):
     """Format a value according to its deduced type.  Empty values are deemed valid for any type.
 
@@ -1306,7 +1820,10 @@ def _format(val, valtype, floatfmt, intfmt, missingval="", has_invisible=True):
 
     >>> hrow = ['\u0431\u0443\u043a\u0432\u0430', '\u0446\u0438\u0444\u0440\u0430'] ; \
         tbl = [['\u0430\u0437', 2], ['\u0431\u0443\u043a\u0438', 4]] ; \
-        good_result = '\\u0431\\u0443\\u043a\\u0432\\u0430      \\u0446\\u0438\\u0444\\u0440\\u0430\\n-------  -------\\n\\u0430\\u0437             2\\n\\u0431\\u0443\\u043a\\u0438           4' ; \
+        good_result = '\\u0431\\u0443\\u043a\\u0432\\u0430      ' \
+            '\\u0446\\u0438\\u0444\\u0440\\u0430\\n-------  -------\\n' \
+            '\\u0430\\u0437             2\\n' \
+            '\\u0431\\u0443\\u043a\\u0438           4' ; \
         tabulate(tbl, headers=hrow) == good_result
     True
 
@@ -1319,7 +1836,9 @@ def _format(val, valtype, floatfmt, intfmt, missingval="", has_invisible=True):
     if valtype is str:
         return f"{val}"
     elif valtype is int:
-        if isinstance(val, str):
+        if isinstance(val, str) and _classify_string(val) is not None:
+            intfmt = ""  # a plain number, no need to look for colors
+        elif isinstance(val, str):
             val_striped = val.encode("unicode_escape").decode("utf-8")
             colored = re.search(r"(\\[xX]+[0-9a-fA-F]+\[\d+[mM]+)([0-9.]+)(\\.*)$", val_striped)
             if colored:
@@ -1337,6 +1856,8 @@ def _format(val, valtype, floatfmt, intfmt, missingval="", has_invisible=True):
         except (TypeError, UnicodeDecodeError):
             return str(val)
     elif valtype is float:
+        if isinstance(val, str) and (_classify_string(val) or ("",))[0] in ("int", "float"):
+            return format(float(val), floatfmt)  # a plain number, no colors or separators
         is_a_colored_number = has_invisible and isinstance(val, (str, bytes))
         if is_a_colored_number:
             raw_val = _strip_ansi(val)
@@ -1397,24 +1918,16 @@ def _reinsert_separating_lines(rows, separating_lines):
             rows.insert(index, SEPARATING_LINE)
 
 
-def _prepend_row_index(rows, index):
+def _prepend_index_column(cols, index, nrows):
     """Add a left-most index column."""
-    if index is None or index is False:
-        return rows
-    if isinstance(index, Sized) and len(index) != len(rows):
+    if index is None:
+        return cols
+    if len(index) != nrows:
         raise ValueError(
             "index must be as long as the number of data rows: "
-            f"len(index)={len(index)} len(rows)={len(rows)}"
+            f"len(index)={len(index)} len(rows)={nrows}"
         )
-    sans_rows, separating_lines = _remove_separating_lines(rows)
-    new_rows = []
-    index_iter = iter(index)
-    for row in sans_rows:
-        index_v = next(index_iter)
-        new_rows.append([index_v] + list(row))
-    rows = new_rows
-    _reinsert_separating_lines(rows, separating_lines)
-    return rows
+    return [index] + cols if nrows else cols
 
 
 def _bool(val):
@@ -1425,9 +1938,24 @@ def _bool(val):
         return False
 
 
-def _normalize_tabular_data(tabular_data, headers, showindex="default"):
-    """Transform a supported data type to a list of lists, and a list of headers,
-    with headers padding.
+def _normalize_tabular_columns(
+    tabular_data, headers, showindex="default", max_rows=None, count_elided_rows=False
+):
+    """Transform a supported data type to a list of columns, a list of headers,
+    with headers padding, the positions of separating lines, a list of column
+    types known from the data source, and the elided rows.
+
+    All columns have the same number of values. Separating lines are removed
+    from the columns, their positions are the row numbers where they should be
+    reinserted (see `_reinsert_separating_lines`). Column types are None unless
+    they are deduced from the dtypes of a pandas.DataFrame.
+
+    If there are more than `max_rows` rows, only the first and the last rows
+    are read into the columns (see `_elide_rows`). The elided rows are then
+    a tuple of the number of the first rows and of the rows left out, and None
+    otherwise. Row indices of the shown rows are the same as of all rows.
+    Separating lines among the elided rows of a sequence are told apart from
+    the rows only if the row indices are shown or if `count_elided_rows`.
 
     Supported tabular data types:
 
@@ -1449,6 +1977,10 @@ def _normalize_tabular_data(tabular_data, headers, showindex="default"):
 
     * pandas.DataFrame (usually used with headers="keys")
 
+    Lists and tuples in a dict of iterables, NumPy arrays and numeric columns
+    of data frames are used as columns without copying their values; data of
+    the other types is read row by row and transposed once.
+
     The first row can be used as headers if headers="firstrow",
     column indices can be used as headers if headers="keys".
 
@@ -1470,46 +2002,100 @@ def _normalize_tabular_data(tabular_data, headers, showindex="default"):
         "\nDid you forget a pair of extra [] or ',' in ()?"
     )
     index = None
+    separating_lines = None
+    coltypes = None
+    elided_rows = None
+    index_is_elided = False
+    # the first row of the data is not a table row if headers="firstrow"
+    nfirst = 1 if headers == "firstrow" else 0
     if hasattr(tabular_data, "keys") and hasattr(tabular_data, "values"):
         # dict-like and pandas.DataFrame?
         if callable(tabular_data.values):
             # likely a conventional dict
             keys = tabular_data.keys()
             try:
-                rows = list(izip_longest(*tabular_data.values()))  # columns have to be transposed
+                cols = [
+                    c if isinstance(c, (list, tuple)) or _is_numpy_array(c) else list(c)
+                    for c in tabular_data.values()
+                ]
+                nrows = max(map(len, cols), default=0)
             except TypeError as e:  # not iterable
                 raise TypeError(err_msg) from e
+            # pad shorter columns with None
+            cols = [c if len(c) == nrows else list(c) + [None] * (nrows - len(c)) for c in cols]
+            if max_rows is not None:
+                shown, elided_rows = _elide_row_numbers(nrows, max_rows, nfirst)
+                if elided_rows is not None:
+                    cols = [
+                        c[shown] if _is_numpy_array(c) else [c[i] for i in shown] for c in cols
+                    ]
+                    nrows = len(shown)
 
         elif hasattr(tabular_data, "index"):
             # values is a property, has .index => it's likely a pandas.DataFrame (pandas 0.11.0)
             keys = list(tabular_data)
+            if max_rows is not None:
+                shown, elided_rows = _elide_row_numbers(len(tabular_data), max_rows, nfirst)
+                if elided_rows is not None:
+                    tabular_data = tabular_data.iloc[shown]
+                    index_is_elided = True
             if showindex in ["default", "always", True] and tabular_data.index.name is not None:
                 if isinstance(tabular_data.index.name, list):
                     keys[:0] = tabular_data.index.name
                 else:
                     keys[:0] = [tabular_data.index.name]
-            vals = tabular_data.values  # values matrix doesn't need to be transposed
+            cols, coltypes = _pandas_columns(tabular_data)
             # for DataFrames add an index per default
             index = list(tabular_data.index)
-            rows = [list(row) for row in vals]
+            nrows = len(index)
         else:
             raise ValueError("tabular data doesn't appear to be a dict or a DataFrame")
 
         if headers == "keys":
             headers = list(map(str, keys))  # headers should be strings
 
-    else:  # it's a usual iterable of iterables, or a NumPy array, or an iterable of dataclasses
+    elif _is_numpy_array(tabular_data) and tabular_data.ndim == 2:
+        # 2D NumPy array, its columns are views of the array
+        if max_rows is not None:
+            shown, elided_rows = _elide_row_numbers(len(tabular_data), max_rows, nfirst)
+            if elided_rows is not None:
+                tabular_data = tabular_data[shown]
+        cols = list(tabular_data.T)
+        nrows = len(tabular_data)
+        if headers == "keys":
+            headers = list(map(str, range(len(cols)))) if nrows else []
+
+    elif _is_numpy_array(tabular_data) and tabular_data.dtype.names:
+        # numpy record array, its fields are views of the array
+        if max_rows is not None:
+            shown, elided_rows = _elide_row_numbers(len(tabular_data), max_rows, nfirst)
+            if elided_rows is not None:
+                tabular_data = tabular_data[shown]
+        cols = [tabular_data[name] for name in tabular_data.dtype.names]
+        nrows = len(tabular_data)
+        if headers == "keys":
+            headers = tabular_data.dtype.names if nrows else []
+
+    else:  # it's a usual iterable of iterables, or an iterable of dataclasses
         try:
-            rows = list(tabular_data)
+            if max_rows is None:
+                rows = list(tabular_data)
+            else:
+                if type(showindex) in [str, bytes]:
+                    count_elided_rows = count_elided_rows or showindex == "always"
+                else:
+                    count_elided_rows = (
+                        count_elided_rows or isinstance(showindex, Iterable) or _bool(showindex)
+                    )
+                rows, elided_rows = _elide_rows(
+                    tabular_data, max_rows, nfirst, count_separating_lines=count_elided_rows
+                )
         except TypeError as e:  # not iterable
             raise TypeError(err_msg) from e
 
         if headers == "keys" and not rows:
             # an empty table (issue #81)
             headers = []
-        elif headers == "keys" and hasattr(tabular_data, "dtype") and tabular_data.dtype.names:
-            # numpy record array
-            headers = tabular_data.dtype.names
         elif (
             headers == "keys"
             and len(rows) > 0
@@ -1573,44 +2159,208 @@ def _normalize_tabular_data(tabular_data, headers, showindex="default"):
             # keys are column indices
             headers = list(map(str, range(len(rows[0]))))
 
-    # take headers from the first row if necessary
-    if headers == "firstrow" and len(rows) > 0:
+        # take headers from the first row if necessary
+        if headers == "firstrow":
+            headers = list(map(str, rows[0])) if rows else []
+            rows = rows[1:]
+
+        rows, separating_lines = _remove_separating_lines(rows)
+        nrows = len(rows)
+        cols = list(izip_longest(*rows))  # rows have to be transposed
+
+    # take headers from the first row of columns if necessary
+    if headers == "firstrow" and nrows > 0:
         if index is not None:
-            headers = [index[0]] + list(rows[0])
+            headers = [index[0]] + [c[0] for c in cols]
             index = index[1:]
         else:
-            headers = rows[0]
-        headers = list(map(str, headers))  # headers should be strings
-        rows = rows[1:]
+            headers = [c[0] for c in cols]
+        cols = [c[1:] for c in cols]
+        nrows -= 1
     elif headers == "firstrow":
         headers = []
 
     headers = list(map(str, headers))
-    #    rows = list(map(list, rows))
-    rows = [r if _is_separating_line(r) else list(r) for r in rows]
+    if nrows == 0:
+        cols = []
+    if coltypes is None or not cols:
+        coltypes = [None] * len(cols)
 
     # add or remove an index column
+    # (indices of all rows, if some of the rows are elided)
+    nhead, nelided = elided_rows or (nrows, 0)
     showindex_is_a_str = type(showindex) in [str, bytes]
-    if showindex_is_a_str and showindex == "default" and index is not None:
-        rows = _prepend_row_index(rows, index)
+    if showindex_is_a_str and showindex == "default":
+        pass  # show the index of a pandas.DataFrame if there is one
     elif isinstance(showindex, Sized) and not showindex_is_a_str:
-        rows = _prepend_row_index(rows, list(showindex))
+        index, index_is_elided = list(showindex), False
     elif isinstance(showindex, Iterable) and not showindex_is_a_str:
-        rows = _prepend_row_index(rows, showindex)
+        index, index_is_elided = list(islice(showindex, nrows + nelided)), False
     elif showindex == "always" or (_bool(showindex) and not showindex_is_a_str):
         if index is None:
-            index = list(range(len(rows)))
-        rows = _prepend_row_index(rows, index)
-    elif showindex == "never" or (not _bool(showindex) and not showindex_is_a_str):
-        pass
+            index = list(range(nrows + nelided))
+    else:
+        index = None
+    if index is not None and not index_is_elided and len(index) == nrows + nelided:
+        index = index[:nhead] + index[nhead + nelided :]
+    if index is not None and nrows:
+        coltypes = [None] + coltypes
+    cols = _prepend_index_column(cols, index, nrows)
 
     # pad with empty headers for initial columns if necessary
     headers_pad = 0
-    if headers and len(rows) > 0:
-        headers_pad = max(0, len(rows[0]) - len(headers))
+    if headers and nrows > 0:
+        headers_pad = max(0, len(cols) - len(headers))
         headers = [""] * headers_pad + headers
 
-    return rows, headers, headers_pad
+    return cols, headers, headers_pad, separating_lines, coltypes, elided_rows
+
+
+def _elide_row_numbers(nrows, max_rows, nfirst=0):
+    """Choose the rows to show if there are more than `max_rows` of `nrows` rows
+    (after `nfirst` rows which are always shown): the first half and the last half
+    of `max_rows` rows. Return the numbers of the rows to show and the elided rows
+    (see `_normalize_tabular_columns`), or None and None if all rows are shown.
+
+    >>> _elide_row_numbers(10, 3)
+    ([0, 1, 9], (2, 7))
+    >>> _elide_row_numbers(10, 3, nfirst=1)
+    ([0, 1, 2, 9], (2, 6))
+    >>> _elide_row_numbers(10, 10)
+    (None, None)
+
+    """
+    nrows -= nfirst
+    if nrows <= max_rows:
+        return None, None
+    nhead, ntail = (max_rows + 1) // 2, max_rows // 2
+    shown = list(range(nfirst + nhead)) + list(range(nfirst + nrows - ntail, nfirst + nrows))
+    return shown, (nhead, nrows - nhead - ntail)
+
+
+def _elide_rows(rows, max_rows, nfirst=0, count_separating_lines=False):
+    """Read the first and the last rows of an iterable of rows if there are more
+    than `max_rows` of them (see `_elide_row_numbers`). The other rows are only
+    counted. Separating lines between the shown rows are kept.
+
+    Return a list of the shown rows (after the first `nfirst` rows) and the
+    elided rows, or the list of all rows and None.
+
+    A sequence is read only at its ends, its elided rows are counted by its
+    length. Separating lines among the elided rows are then counted as rows,
+    unless `count_separating_lines`, which makes it read all of the rows.
+
+    >>> _elide_rows(iter(range(10)), 3)
+    ([0, 1, 9], (2, 7))
+    >>> _elide_rows([[0], [1], SEPARATING_LINE, [2], [3]], 2)
+    ([[0], [3]], (1, 3))
+    >>> _elide_rows([[0], [1], SEPARATING_LINE, [2], [3]], 2, count_separating_lines=True)
+    ([[0], [3]], (1, 2))
+
+    """
+    if isinstance(rows, Sequence):
+        return _elide_sequence_rows(rows, max_rows, nfirst, count_separating_lines)
+    rows = iter(rows)
+    nhead, ntail = (max_rows + 1) // 2, max_rows // 2
+    head = list(islice(rows, nfirst))
+    ndatarows = 0
+    if nhead:
+        for row in rows:
+            head.append(row)
+            if not _is_separating_line(row):
+                ndatarows += 1
+                if ndatarows == nhead:
+                    break
+    # the last rows, each with the separating lines before it
+    tail = deque(maxlen=ntail)
+    separating_lines = []
+    nelided = 0
+    for row in rows:
+        if _is_separating_line(row):
+            separating_lines.append(row)
+            continue
+        if len(tail) == ntail:
+            nelided += 1  # the first of the last rows is elided
+        tail.append((separating_lines, row))
+        separating_lines = []
+    for row_separating_lines, row in tail:
+        head.extend(row_separating_lines)
+        head.append(row)
+    head.extend(separating_lines)
+    return head, ((nhead, nelided) if nelided else None)
+
+
+def _elide_sequence_rows(rows, max_rows, nfirst, count_separating_lines):
+    "Elide the rows of a sequence taking only its first and last rows, see `_elide_rows`."
+    nrows = len(rows)
+    nhead, ntail = (max_rows + 1) // 2, max_rows // 2
+    # the first rows end after the nhead-th data row
+    head_end, ndatarows = min(nfirst, nrows), 0
+    while ndatarows < nhead and head_end < nrows:
+        if not _is_separating_line(rows[head_end]):
+            ndatarows += 1
+        head_end += 1
+    # the last rows start after a data row, with the separating lines before them
+    tail_start, ndatarows = nrows, 0
+    while tail_start > head_end:
+        if not _is_separating_line(rows[tail_start - 1]):
+            if ndatarows == ntail:
+                break
+            ndatarows += 1
+        tail_start -= 1
+    if tail_start == head_end:
+        return list(rows), None
+    nelided = tail_start - head_end
+    if count_separating_lines:
+        elided = (rows[i] for i in range(head_end, tail_start))
+        nelided -= sum(map(_is_separating_line, elided))
+    shown = chain(range(head_end), range(tail_start, nrows))
+    return [rows[i] for i in shown], (nhead, nelided)
+
+
+def _pandas_columns(df):
+    """Columns of a pandas.DataFrame and their types, deduced from the dtypes.
+
+    The frame is read column by column, numeric columns are NumPy arrays
+    which share memory with the frame. Missing values of nullable numbers,
+    dates and categories are replaced with None, missing values of text
+    columns are kept (like NaN in float columns).
+
+    """
+    cols, coltypes = [], []
+    for i in range(df.shape[1]):
+        series = df.iloc[:, i]
+        dtype = series.dtype
+        kind = getattr(dtype, "kind", "O")
+        is_numpy_dtype = str(type(dtype)).startswith("<class 'numpy.")
+        coltype = {"i": int, "u": int, "f": float, "b": bool}.get(kind)
+        if is_numpy_dtype and kind in "iufb":
+            values = series.to_numpy()
+        elif kind in "Mm":  # datetime64 and timedelta64, with or without a timezone
+            values, coltype = series.to_numpy(dtype=object), str
+            values[series.isna().to_numpy()] = None
+        elif is_numpy_dtype:  # object columns
+            values = series.to_numpy()
+        elif kind == "O" and not hasattr(dtype, "categories"):  # text and other objects
+            values = series.to_numpy(dtype=object)
+        elif hasattr(dtype, "categories"):  # values keep the types of the categories
+            codes = series.cat.codes.to_numpy()
+            categories = dtype.categories.to_numpy(dtype=object)
+            values = categories.take(codes) if len(categories) else codes.astype(object)
+            values[codes < 0] = None
+            coltype = _column_type(dtype.categories)
+        elif coltype is not None and not series.hasnans:  # nullable numbers without NA
+            values = series.to_numpy(dtype=dtype.numpy_dtype)
+        else:
+            values = series.to_numpy(dtype=object, na_value=None)
+        cols.append(values)
+        coltypes.append(coltype)
+    return cols, coltypes
+
+
+def _is_numpy_array(data):
+    "True if `data` looks like a NumPy array, but not like a pandas object."
+    return hasattr(data, "dtype") and hasattr(data, "ndim") and not hasattr(data, "index")
 
 
 def _wrap_text_to_colwidths(
@@ -1632,42 +2382,60 @@ def _wrap_text_to_colwidths(
     for row in list_of_lists:
         new_row = []
         for cell, width, numparse in zip(row, colwidths, numparses):
-            if _isnumber(cell) and numparse:
-                new_row.append(cell)
-                continue
-
-            if width is not None:
-                wrapper = _CustomTextWrap(
-                    width=width,
-                    break_long_words=break_long_words,
-                    break_on_hyphens=break_on_hyphens,
+            new_row.append(
+                _wrap_text_cell(
+                    cell, width, numparse, missingval, break_long_words, break_on_hyphens
                 )
-                # Cast based on our internal type handling. Any future custom
-                # formatting of types (such as datetimes) may need to be more
-                # explicit than just `str` of the object. Also doesn't work for
-                # custom floatfmt/intfmt, nor with any missing/blank cells.
-                casted_cell = (
-                    missingval
-                    if cell is None
-                    else (
-                        str(cell)
-                        if cell == "" or _isnumber(cell)
-                        else str(_type(cell, numparse)(cell))
-                    )
-                )
-                wrapped = [
-                    "\n".join(wrapper.wrap(line))
-                    for line in casted_cell.splitlines()
-                    if line.strip() != ""
-                ]
-                new_row.append("\n".join(wrapped))
-            else:
-                new_row.append(cell)
+            )
         result.append(new_row)
 
     return result
 
 
+def _wrap_text_column(
+    column,
+    width,
+    numparse=True,
+    missingval=_DEFAULT_MISSINGVAL,
+    break_long_words=_BREAK_LONG_WORDS,
+    break_on_hyphens=_BREAK_ON_HYPHENS,
+):
+    "Column-wise version of `_wrap_text_to_colwidths`."
+    if width is None:
+        return column
+    return [
+        _wrap_text_cell(cell, width, numparse, missingval, break_long_words, break_on_hyphens)
+        for cell in column
+    ]
+
+
+def _wrap_text_cell(cell, width, numparse, missingval, break_long_words, break_on_hyphens):
+    if _isnumber(cell) and numparse:
+        return cell
+
+    if width is None:
+        return cell
+
+    wrapper = _CustomTextWrap(
+        width=width,
+        break_long_words=break_long_words,
+        break_on_hyphens=break_on_hyphens,
+    )
+    # Cast based on our internal type handling. Any future custom
+    # formatting of types (such as datetimes) may need to be more
+    # explicit than just `str` of the object. Also doesn't work for
+    # custom floatfmt/intfmt, nor with any missing/blank cells.
+    casted_cell = (
+        missingval
+        if cell is None
+        else (str(cell) if cell == "" or _isnumber(cell) else str(_type(cell, numparse)(cell)))
+    )
+    wrapped = [
+        "\n".join(wrapper.wrap(line)) for line in casted_cell.splitlines() if line.strip() != ""
+    ]
+    return "\n".join(wrapped)
+
+
 def _to_str(s, encoding="utf8", errors="ignore"):
     """
     A type safe wrapper for converting a bytestring to str. This is essentially just
@@ -1714,6 +2482,9 @@ def tabulate(
     maxheadercolwidths=None,
     break_long_words=_BREAK_LONG_WORDS,
     break_on_hyphens=_BREAK_ON_HYPHENS,
+    typeinfer="full",
+    max_rows=None,
+    workers=None,
 ):
     """Format a fixed width table for pretty printing.
 
@@ -2207,6 +2978,43 @@ def tabulate(
     e.g. `disable_numparse=[0, 2]` would disable number parsing only on the
     first and third columns.
 
+    By default, all values of a column are inspected to deduce its type.
+    For tall tables, `typeinfer="sample:N"` deduces the type of every column
+    from a sample of N values (the first ones and evenly spaced others), and
+    then only checks that the other values are of that type, which is much
+    cheaper for plain numbers. The deduced types are the same:
+
+    >>> print(tabulate([[1], [2.5], ["x"]], typeinfer="sample:1"))
+    ---
+    1
+    2.5
+    x
+    ---
+
+    Long tables
+    -----------
+    With `max_rows=N`, a table of more than N rows shows only its first and
+    last rows (N in total) and a row of ellipses in place of the others.
+    The elided rows are never formatted, but they are counted, so row
+    indices continue after the ellipses:
+
+    >>> print(tabulate([[i, i / 4] for i in range(100)], max_rows=4, showindex=True))
+    ---  ---  ------
+      0    0    0
+      1    1    0.25
+    ...  ...  ...
+     98   98   24.5
+     99   99   24.75
+    ---  ---  ------
+
+    Parallel processing
+    -------------------
+    The columns of a table are typed, formatted and aligned independently,
+    and then the rows are rendered independently. With `workers=N`, the
+    columns and then chunks of rows of big tables are processed in N worker
+    processes; `workers` may also be a `concurrent.futures.Executor` to run
+    these jobs in. The output is the same as without workers.
+
     Column Widths and Auto Line Wrapping
     ------------------------------------
     Tabulate will, by default, set the width of each column to the length of the
@@ -2233,67 +3041,922 @@ def tabulate(
     Header column width can be specified in a similar way using `maxheadercolwidths`.
 
     """
-
-    if tabular_data is None:
-        tabular_data = []
-
-    list_of_lists, headers, headers_pad = _normalize_tabular_data(
-        tabular_data, headers, showindex=showindex
-    )
-    list_of_lists, separating_lines = _remove_separating_lines(list_of_lists)
-
-    if maxcolwidths is not None:
-        if type(maxcolwidths) is tuple:  # Check if tuple, convert to list if so
-            maxcolwidths = list(maxcolwidths)
-        if len(list_of_lists):
-            num_cols = len(list_of_lists[0])
-        else:
-            num_cols = 0
-        if isinstance(maxcolwidths, int):  # Expand scalar for all columns
-            maxcolwidths = _expand_iterable(maxcolwidths, num_cols, maxcolwidths)
-        else:  # Ignore col width for any 'trailing' columns
-            maxcolwidths = _expand_iterable(maxcolwidths, num_cols, None)
-
-        numparses = _expand_numparse(disable_numparse, num_cols)
-        list_of_lists = _wrap_text_to_colwidths(
-            list_of_lists,
-            maxcolwidths,
-            numparses=numparses,
+    # the columns and the rows of the table share one process pool
+    pool = _WorkerPool(workers) if isinstance(workers, int) and workers > 1 else workers
+    try:
+        layout = _tabulate_layout(
+            tabular_data,
+            headers,
+            tablefmt,
+            floatfmt=floatfmt,
+            intfmt=intfmt,
+            numalign=numalign,
+            stralign=stralign,
             missingval=missingval,
+            showindex=showindex,
+            disable_numparse=disable_numparse,
+            colglobalalign=colglobalalign,
+            colalign=colalign,
+            preserve_whitespace=preserve_whitespace,
+            maxcolwidths=maxcolwidths,
+            headersglobalalign=headersglobalalign,
+            headersalign=headersalign,
+            rowalign=rowalign,
+            maxheadercolwidths=maxheadercolwidths,
             break_long_words=break_long_words,
             break_on_hyphens=break_on_hyphens,
+            typeinfer=typeinfer,
+            max_rows=max_rows,
+            workers=pool,
         )
+        return _format_table(
+            layout.fmt,
+            layout.headers,
+            layout.headersaligns,
+            layout.iter_rows(),
+            layout.colwidths,
+            layout.colaligns,
+            layout.is_multiline,
+            layout.rowaligns,
+            workers=pool,
+        )
+    finally:
+        if isinstance(pool, _WorkerPool):
+            pool.shutdown()
 
-    if maxheadercolwidths is not None:
-        num_cols = len(list_of_lists[0]) if list_of_lists else len(headers)
-        if isinstance(maxheadercolwidths, int):  # Expand scalar for all columns
-            maxheadercolwidths = _expand_iterable(maxheadercolwidths, num_cols, maxheadercolwidths)
-        else:  # Ignore col width for any 'trailing' columns
-            maxheadercolwidths = _expand_iterable(maxheadercolwidths, num_cols, None)
 
-        numparses = _expand_numparse(disable_numparse, num_cols)
-        headers = _wrap_text_to_colwidths(
-            [headers],
-            maxheadercolwidths,
-            numparses=numparses,
-            missingval=missingval,
-            break_long_words=break_long_words,
-            break_on_hyphens=break_on_hyphens,
-        )[0]
+def tabulate_iter(
+    tabular_data, headers=(), tablefmt="simple", *, sample=None, colwidths=None, **kwargs
+):
+    """Format a table like `tabulate` does, but yield the lines of the table
+    one at a time instead of returning a single string.
 
-    # empty values in the first column of RST tables should be escaped (issue #82)
-    # "" should be escaped as "\\ " or ".."
-    if tablefmt == "rst":
-        list_of_lists, headers = _rst_escape_first_column(list_of_lists, headers)
+    Accepts the same arguments as `tabulate`. The lines are not terminated
+    by a newline character, so `"\\n".join(tabulate_iter(...))` is the same
+    as `tabulate(...)`:
 
-    # PrettyTable formatting does not use any extra padding.
-    # Numbers are not parsed and are treated the same as strings for alignment.
-    # Check if pretty is the format being used and override the defaults so it
-    # does not impact other formats.
-    min_padding = MIN_PADDING
-    if tablefmt == "pretty":
-        min_padding = 0
-        disable_numparse = True
+    >>> for line in tabulate_iter([["spam", 41.9999], ["eggs", "451.0"]]):
+    ...     print(line)
+    ----  --------
+    spam   41.9999
+    eggs  451
+    ----  --------
+
+    The table layout (column types, widths and alignments) is computed when
+    `tabulate_iter` is called, the lines are rendered lazily, so the full output
+    string is never built in memory.
+
+    Tables of unknown length
+    ------------------------
+
+    By default all rows of `tabular_data` are read before the first line is
+    produced. If `sample` (a number of rows) or `colwidths` (a list of column
+    widths) is given, only the first `sample` rows are read to choose column
+    types, widths and alignments, and the following rows are formatted and
+    yielded as soon as they are read. This way a table of an infinite
+    iterator of rows can be rendered in bounded memory:
+
+    >>> from itertools import count
+    >>> rows = ([i, 2**i] for i in count())
+    >>> lines = tabulate_iter(rows, ["n", "2**n"], sample=2, tablefmt="psql")
+    >>> for _, line in zip(range(7), lines):
+    ...     print(line)
+    +-----+--------+
+    |   n |   2**n |
+    |-----+--------|
+    |   0 |      1 |
+    |   1 |      2 |
+    |   2 |      4 |
+    |   3 |      8 |
+
+    If `colwidths` are given, they are used as widths of the respective columns
+    (`None` to choose the width of a column from the sample). For numbers they
+    are minimal widths: a column is wider if the sample has wider numbers in
+    it. Text of the
+    following rows which is too wide for its column is wrapped in the table
+    formats which support multiline cells, and truncated in the others.
+    Numbers are never cut, they overflow their columns. `sample` defaults to
+    100 rows.
+
+    """
+    if sample is None and colwidths is None:
+        layout = _tabulate_layout(tabular_data, headers, tablefmt, **kwargs)
+        return layout.iter_lines()
+    return _iter_streamed_table_lines(
+        tabular_data,
+        headers,
+        tablefmt,
+        _STREAM_SAMPLE_SIZE if sample is None else sample,
+        colwidths,
+        kwargs,
+    )
+
+
+def write_table(file, tabular_data, headers=(), tablefmt="simple", **kwargs):
+    """Format a table like `tabulate` does and write it to a text file object.
+
+    Accepts the same arguments as `tabulate` and `tabulate_iter`. Every line of
+    the table, including the last one, is terminated with a newline character,
+    as if the table were printed with `print(tabulate(...), file=file)`:
+
+    >>> import io
+    >>> buf = io.StringIO()
+    >>> write_table(buf, [["spam", 41.9999], ["eggs", "451.0"]], tablefmt="plain")
+    >>> print(buf.getvalue(), end="")
+    spam   41.9999
+    eggs  451
+
+    The lines are rendered lazily and written in batches with `file.writelines`,
+    so the full output string is never built in memory.
+
+    """
+    lines = tabulate_iter(tabular_data, headers, tablefmt, **kwargs)
+    empty = True
+    while True:
+        batch = list(islice(lines, _WRITE_BATCH_SIZE))
+        if not batch:
+            break
+        file.writelines([line + "\n" for line in batch])
+        empty = False
+    if empty:  # print() writes a newline after an empty table too
+        file.write("\n")
+
+
+def paginate(tabular_data, page_size, headers=(), tablefmt="simple", **kwargs):
+    """Format a table like `tabulate` does, and split it into pages of `page_size`
+    rows each, with the headers repeated on every page.
+
+    Accepts the same arguments as `tabulate`. Column types, widths and alignments
+    are chosen once for all rows of the table, so all pages have the same columns.
+    Return a sequence of pages, every page is rendered when it is taken:
+
+    >>> pages = paginate([["spam", 1], ["eggs", 451], ["ham", 12.5]], 2, ["item", "qty"])
+    >>> len(pages)
+    2
+    >>> print(pages[1])
+    item      qty
+    ------  -----
+    ham      12.5
+
+    Separating lines between the pages are not shown. A table without rows
+    has a single page (with headers only).
+
+    """
+    if not isinstance(page_size, int) or page_size < 1:
+        raise ValueError(f"page_size must be a positive number of rows, got {page_size!r}")
+    layout = _tabulate_layout(tabular_data, headers, tablefmt, **kwargs)
+    return _TablePages(layout, page_size)
+
+
+class _TablePages(Sequence):
+    "Pages of a table, see `paginate`."
+
+    def __init__(self, layout, page_size):
+        self._layout = layout
+        self._page_size = page_size
+        self._nrows = len(layout.cols[0]) if layout.cols else 0
+        # the number of rows before every separating line
+        self._separating_lines = [
+            lineno - nseparators
+            for nseparators, lineno in enumerate(sorted(set(layout.separating_lines or ())))
+        ]
+
+    def __len__(self):
+        return max(1, -(-self._nrows // self._page_size))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("page index out of range")
+        start = index * self._page_size
+        end = min(start + self._page_size, self._nrows)
+        separating_lines = [
+            nrows - start + nseparators
+            for nseparators, nrows in enumerate(
+                nrows for nrows in self._separating_lines if start < nrows < end
+            )
+        ]
+        layout = self._layout
+        page = dataclasses.replace(
+            layout,
+            cols=[col[start:end] for col in layout.cols],
+            separating_lines=separating_lines,
+            rowaligns=layout.rowaligns[start:end],
+        )
+        return _join_table_lines(layout.fmt, page.iter_lines())
+
+
+class Table:
+    """A table which grows by appending rows, and which can be rendered after
+    every batch of rows without formatting all of its rows again.
+
+    `rows`, `headers`, `tablefmt` and the keyword `options` are the same as the
+    arguments of `tabulate`, and `str(table)` is the same as `tabulate(rows,
+    headers, tablefmt, **options)` of all the rows appended so far:
+
+    >>> table = Table([["spam", 41.9999]], ["item", "qty"])
+    >>> table.append_rows([["eggs", "451.0"]])
+    >>> print(table)
+    item         qty
+    ------  --------
+    spam     41.9999
+    eggs    451
+
+    The columns, their types, widths and number of digits after the decimal
+    point, the padded cells and the lines of the rows are kept between the
+    renderings. The new rows are formatted and rendered, the previous rows
+    only if the width or the alignment of some column changed (e.g. a new
+    value is wider than the column, or has more digits after the decimal point).
+
+    Rows are lists or tuples of values, or `SEPARATING_LINE`.
+
+    Redrawing a table
+    -----------------
+
+    `update` replaces the rows of the table, and returns only the lines of the
+    table which changed since its previous rendering, with their line numbers
+    (starting from 0):
+
+    >>> table = Table([["spam", 42], ["eggs", 451]], ["item", "qty"], "psql")
+    >>> print(table)
+    +--------+-------+
+    | item   |   qty |
+    |--------+-------|
+    | spam   |    42 |
+    | eggs   |   451 |
+    +--------+-------+
+    >>> diff = table.update([["spam", 41], ["eggs", 451], ["ham", 7]])
+    >>> diff.nlines, diff.full_redraw
+    (7, False)
+    >>> for lineno, line in diff.lines:
+    ...     print(lineno, line)
+    3 | spam   |    41 |
+    5 | ham    |     7 |
+    6 +--------+-------+
+
+    `full_redraw` is true if the widths of the columns changed since the previous
+    rendering, then all `lines` are returned. `nlines` is the number of lines of
+    the table (the lines of the previous rendering after them should be cleared).
+    Line numbers count the lines of the output, also where a row of a table
+    format (e.g. "html") takes several lines.
+    `diff` does the same for the rows appended with `append_rows`.
+
+    """
+
+    def __init__(self, rows=(), headers=(), tablefmt="simple", **options):
+        if options.get("max_rows") is not None:
+            raise ValueError("max_rows cannot be used with a Table")
+        self.tablefmt = tablefmt
+        self.options = options
+        self._headers_arg = headers
+        self._headers = headers if isinstance(headers, str) else list(map(str, headers))
+        self._rows = []  # rows and separating lines
+        self._cols = []
+        self._col_starts = []  # the first row of every column
+        self._nrows = 0
+        self._separating_lines = []
+        self._cache = _ColumnCache()
+        self._rendering = None  # table format, column widths and lines of the last rendering
+        # an iterator of row indices is read once, as far as there are rows
+        showindex = options.get("showindex")
+        self._index = self._index_iter = None
+        if isinstance(showindex, Iterable) and not isinstance(showindex, (str, bytes, Sized)):
+            self._index, self._index_iter = [], iter(showindex)
+        self.append_rows(rows)
+
+    def __len__(self):
+        "The number of rows in the table (without headers and separating lines)."
+        return self._nrows
+
+    def append_rows(self, rows):
+        """Append rows to the table. Rows may have more or less values than the
+        previous rows, missing values are None (as in `tabulate`)."""
+        cols = self._cols
+        for row in rows:
+            if _is_separating_line(row):
+                self._separating_lines.append(len(self._rows))
+                self._rows.append(row)
+                continue
+            if hasattr(row, "keys") and hasattr(row, "values"):
+                raise TypeError("rows of a Table must be lists or tuples of values, not dicts")
+            if self._headers == "firstrow":
+                self._headers = list(map(str, row))
+                continue
+            row = list(row)
+            for _ in range(len(cols), len(row)):
+                cols.append([None] * self._nrows)
+                self._col_starts.append(self._nrows)
+            for col, value in izip_longest(cols, row):
+                col.append(value)
+            self._rows.append(row)
+            self._nrows += 1
+
+    def update(self, rows):
+        """Replace the rows of the table with `rows`, and return the lines of the
+        table which changed since its previous rendering, see `diff`.
+
+        Only the changed rows are formatted again, and the rows after the first
+        inserted or removed row (or separating line)."""
+        rows = list(rows)
+        if self._headers_arg == "firstrow":
+            self._headers = list(map(str, rows[0])) if rows else "firstrow"
+            rows = rows[1:]
+        nkept = min(len(self._rows), len(rows))
+        replaced = []  # data rows which are replaced in place
+        for k, (old, new) in enumerate(zip(self._rows, rows)):
+            if old == new and _same_values(old, new):
+                continue
+            if _is_separating_line(old) or _is_separating_line(new):
+                nkept = k
+                break
+            if hasattr(new, "keys") and hasattr(new, "values"):
+                nkept = k
+                break
+            new = list(new)
+            if len(new) != len(old):  # the number of columns may change
+                nkept = k
+                break
+            if not _same_values(old, new):
+                replaced.append((k, k - bisect_left(self._separating_lines, k), new))
+        self._truncate(nkept)
+        for k, nrow, row in replaced:
+            self._rows[k] = row
+            for col, value in izip_longest(self._cols, row):
+                col[nrow] = value
+            self._cache.changed_rows.add(nrow)
+        self.append_rows(rows[nkept:])
+        return self.diff()
+
+    def _truncate(self, nitems):
+        "Keep only the first `nitems` rows and separating lines of the table."
+        if nitems >= len(self._rows):
+            return
+        del self._rows[nitems:]
+        self._separating_lines = [i for i in self._separating_lines if i < nitems]
+        self._nrows = nrows = nitems - len(self._separating_lines)
+        ncols = bisect_left(self._col_starts, nrows)
+        del self._cols[ncols:], self._col_starts[ncols:]
+        for col in self._cols:
+            del col[nrows:]
+        self._cache.truncate(nrows, nitems)
+
+    def _render_lines(self):
+        """Render the table, return its format, its lines, and the lines of the
+        previous rendering if they can be updated line by line (or None).
+
+        Lines are the lines of the output: the rendered rows and rules which
+        span several lines (e.g. in "html" or "latex" formats) are split."""
+        headers = [] if self._headers == "firstrow" else self._headers
+        options = self.options
+        if self._index is not None:
+            self._index.extend(islice(self._index_iter, self._nrows - len(self._index)))
+            options = {**options, "showindex": self._index[: self._nrows]}
+        layout = _tabulate_layout(
+            dict(enumerate(self._cols)), headers, self.tablefmt, cache=self._cache, **options
+        )
+        layout.separating_lines = self._separating_lines
+        lines = list(
+            _iter_table_lines(
+                layout.fmt,
+                layout.headers,
+                layout.headersaligns,
+                layout.iter_rows(),
+                layout.colwidths,
+                layout.colaligns,
+                layout.is_multiline,
+                layout.rowaligns,
+                cache=self._cache,
+            )
+        )
+        if lines:
+            lines = "\n".join(lines).split("\n")
+        prev, self._rendering = self._rendering, (layout.fmt, layout.colwidths, lines)
+        if prev is not None and prev[:2] == (layout.fmt, layout.colwidths):
+            return layout.fmt, lines, prev[2]
+        return layout.fmt, lines, None
+
+    def render(self):
+        """Format the table, see `tabulate`."""
+        fmt, lines, _ = self._render_lines()
+        return _join_table_lines(fmt, lines)
+
+    def __str__(self):
+        return self.render()
+
+    def diff(self):
+        """Render the table and return the lines which changed since its previous
+        rendering (by `render`, `diff` or `update`), see `Table`."""
+        _, lines, prev_lines = self._render_lines()
+        if prev_lines is None:
+            return _TableDiff(list(enumerate(lines)), len(lines), True)
+        changed = [
+            (i, line)
+            for i, (line, prev_line) in enumerate(izip_longest(lines, prev_lines[: len(lines)]))
+            if line != prev_line
+        ]
+        return _TableDiff(changed, len(lines), False)
+
+
+_TableDiff = namedtuple("TableDiff", ["lines", "nlines", "full_redraw"])
+
+
+def _same_values(old, new):
+    """Whether two rows have equal values of the same types (values such as
+    1, 1.0 and True are equal, but they are formatted differently)."""
+    return len(old) == len(new) and all(type(o) is type(n) and o == n for o, n in zip(old, new))
+
+
+def _iter_streamed_table_lines(tabular_data, headers, tablefmt, sample, colwidths, kwargs):
+    """Yield the lines of a table, choosing its layout from the first `sample` rows.
+
+    See `tabulate_iter`.
+
+    """
+    if sample < 1:
+        raise ValueError(f"sample must be a positive number of rows, got {sample!r}")
+    if kwargs.get("max_rows") is not None:
+        raise ValueError("max_rows cannot be used with sample or colwidths")
+    kwargs = dict(kwargs)
+    if colwidths is not None:
+        colwidths = list(colwidths)
+        kwargs["maxcolwidths"] = colwidths
+        kwargs["maxheadercolwidths"] = colwidths
+        kwargs["mincolwidths"] = colwidths
+
+    if hasattr(tabular_data, "keys") and hasattr(tabular_data, "values"):
+        # dicts of columns and data frames are not read row by row
+        head, rows = tabular_data, iter(())
+    else:
+        rows = iter(tabular_data if tabular_data is not None else [])
+        nhead = sample + 1 if headers == "firstrow" else sample
+        head = list(islice(rows, nhead))
+
+    # continue row indices from the sample to the following rows
+    showindex = kwargs.get("showindex", "default")
+    showindex_is_a_str = type(showindex) in [str, bytes]
+    index = None
+    if isinstance(showindex, Iterable) and not showindex_is_a_str:
+        index = iter(showindex)
+    elif showindex == "always" or (_bool(showindex) and not showindex_is_a_str):
+        index = count()
+    if index is not None and isinstance(head, list):
+        nrows = sum(not _is_separating_line(row) for row in head)
+        if headers == "firstrow" and head:
+            nrows -= 1
+        kwargs["showindex"] = list(islice(index, nrows))
+
+    layout = _tabulate_layout(head, headers, tablefmt, **kwargs)
+
+    # values of dicts and dataclasses are read in the same order as in the sample
+    first_row = next((row for row in head if not _is_separating_line(row)), None)
+    if hasattr(first_row, "keys") and hasattr(first_row, "values"):
+        rows_of_sample = (row for row in head if not _is_separating_line(row))
+        keys = list(dict.fromkeys(k for row in rows_of_sample for k in row))
+
+        def row_values(row):
+            return [row.get(k) for k in keys]
+
+    elif dataclasses.is_dataclass(first_row):
+        field_names = [field.name for field in dataclasses.fields(first_row)]
+
+        def row_values(row):
+            return [getattr(row, f) for f in field_names]
+
+    else:
+        row_values = list
+
+    can_wrap = not isinstance(tablefmt, TableFormat) and tablefmt in multiline_formats
+    format_row = _StreamedRowFormatter(
+        layout,
+        can_wrap,
+        escape_first_column=(tablefmt == "rst"),
+        break_long_words=kwargs.get("break_long_words", _BREAK_LONG_WORDS),
+        break_on_hyphens=kwargs.get("break_on_hyphens", _BREAK_ON_HYPHENS),
+    )
+
+    def more_rows():
+        for row in rows:
+            if _is_separating_line(row):
+                yield SEPARATING_LINE
+            else:
+                values = row_values(row)
+                if index is not None:
+                    values = [next(index)] + values
+                yield format_row(values)
+
+    rowalign = kwargs.get("rowalign")
+    rowaligns = chain(layout.rowaligns, repeat(rowalign if isinstance(rowalign, str) else None))
+    layout.is_multiline = layout.is_multiline or can_wrap
+    yield from layout.iter_lines(chain(layout.iter_rows(), more_rows()), rowaligns)
+
+
+class _StreamedRowFormatter:
+    """Format and pad rows of data to fit into an already computed table layout."""
+
+    def __init__(self, layout, can_wrap, escape_first_column, break_long_words, break_on_hyphens):
+        self.layout = layout
+        self.can_wrap = can_wrap
+        self.escape_first_column = escape_first_column
+        self.wrapper_options = {
+            "break_long_words": break_long_words,
+            "break_on_hyphens": break_on_hyphens,
+        }
+        # digits after the decimal point, as in the padded cells of the sample
+        self.decimals = [-1] * len(layout.colwidths)
+        for i, (col, align) in enumerate(zip(layout.cols, layout.cellaligns)):
+            if align == "decimal":
+                if layout.has_invisible:
+                    col = map(_strip_ansi, col)
+                self.decimals[i] = max((_afterpoint(cell.strip()) for cell in col), default=-1)
+
+    def __call__(self, values):
+        ncols = len(self.layout.colwidths)
+        values = (list(values) + [None] * ncols)[:ncols]
+        if self.escape_first_column and values:
+            values[0] = _rst_escape_first_column([values[:1]], [])[0][0][0]
+        return [self.format_cell(i, val) for i, val in enumerate(values)]
+
+    def format_cell(self, i, val):
+        layout = self.layout
+        has_invisible = layout.has_invisible or (
+            isinstance(val, (str, bytes)) and _ansi_codes.search(_to_str(val)) is not None
+        )
+        # a value may be of a more generic type than the values in the sample
+        valtype = _more_generic(
+            layout.coltypes[i] if i < len(layout.coltypes) else type(None),
+            _type(val, numparse=layout.numparses[i] if i < len(layout.numparses) else True),
+        )
+        if i < len(layout.coltypes):
+            cell = _format(
+                val,
+                valtype,
+                layout.float_formats[i],
+                layout.int_formats[i],
+                layout.missing_vals[i],
+                has_invisible,
+            )
+            align = layout.cellaligns[i]
+        else:  # no values in the sample, only headers
+            cell = _format(val, valtype, _DEFAULT_FLOATFMT, _DEFAULT_INTFMT)
+            align = "left"
+        width = layout.colwidths[i]
+        width_fn = _choose_width_fn(has_invisible, layout.enable_widechars, self.can_wrap)
+        if valtype in (int, float) and width_fn(cell) > width:
+            # numbers are never cut, they overflow the column
+            align = "right" if align == "decimal" else align
+        elif width_fn(cell) > width:
+            cell = self.fit_cell(cell, width, width_fn)
+        elif align == "decimal":
+            decimals = _afterpoint(_strip_ansi(cell) if has_invisible else cell)
+            padded = cell + (self.decimals[i] - decimals) * " "
+            if width_fn(padded) <= width:
+                cell = padded
+            else:
+                align = "right"
+        return _align_column(
+            [cell],
+            align,
+            width,
+            has_invisible,
+            layout.enable_widechars,
+            "\n" in cell,
+            layout.preserve_whitespace,
+        )[0]
+
+    def fit_cell(self, cell, width, width_fn):
+        """Wrap a cell which is too wide for its column into lines of at most
+        `width` (in the multiline formats), or truncate it to its first line."""
+        if width < 1:
+            return ""
+        wrapper = _CustomTextWrap(width=width, **self.wrapper_options)
+        breaker = _CustomTextWrap(width=width, break_long_words=True)
+        lines = []
+        for line in cell.splitlines() if self.can_wrap else [cell]:
+            for wrapped in wrapper.wrap(line):
+                # words which are still too long are broken anyway
+                lines.extend(breaker.wrap(wrapped) if width_fn(wrapped) > width else [wrapped])
+        if self.can_wrap:
+            return "\n".join(lines)
+        return lines[0] if lines else ""
+
+
+class _ColumnCache:
+    """Results of the column by column steps of `_tabulate_layout` for a table
+    which grows by appending rows (see `Table`), so that the next layout of the
+    table applies every step only to the appended (or changed) values.
+
+    Every result is stored with a key of the arguments it depends on (including
+    the version of the values it was computed from), and is computed again from
+    scratch if the key changes.
+
+    """
+
+    def __init__(self):
+        self._mapped = {}
+        self._folded = {}
+        self._versions = count(1)
+        self._row_lines = None
+        self.changed_rows = set()  # rows whose values changed since the last layout
+        self._layout = 0
+        self._last_changed = 0  # the last layout with changed rows
+        self.start(0)
+
+    def start(self, nrows):
+        "Start a new layout of the table of `nrows` rows."
+        self._layout += 1
+        self._input_versions = {}  # column -> version of its values, 0 for the original values
+        self.unchanged_rows = nrows  # rows which are padded the same as in the previous layout
+
+    def truncate(self, nrows, nitems):
+        """Forget the results for all but the first `nrows` rows of the table, or
+        the first `nitems` rows and separating lines (the others were changed)."""
+        for k, (key, n, result, result_version, layout) in self._mapped.items():
+            if n > nrows:
+                del result[nrows:]
+                self._mapped[k] = (key, nrows, result, result_version, layout)
+        nblocks = nrows // _COLUMN_BLOCK_SIZE
+        for k, (key, n, blocks, layout) in self._folded.items():
+            if n > nrows:
+                del blocks[nblocks:]
+                self._folded[k] = (key, nblocks * _COLUMN_BLOCK_SIZE, blocks, layout)
+        if self._row_lines is not None:
+            _, item_lines, ndatarows = self._row_lines
+            del item_lines[nitems:], ndatarows[nitems:]
+        self.changed_rows = {r for r in self.changed_rows if r < nrows}
+
+    def map(self, step, i, key, fn, values):
+        """Return `fn(values)` for the column `i`, where `fn` maps a list of values
+        element by element (and returns a list). The following steps of the column
+        take the result as their input values."""
+        key = (key, self._input_versions.get(i, 0))
+        prev = self._mapped.get((step, i))
+        if self._is_valid(prev, key, len(values)):
+            _, n, result, result_version, _ = prev
+            for r in self.changed_rows:
+                if r < n:
+                    result[r : r + 1] = fn(values[r : r + 1])
+            result.extend(fn(values[n:]) if n < len(values) else ())
+        else:
+            result, result_version = list(fn(values)), next(self._versions)
+        self._mapped[(step, i)] = (key, len(values), result, result_version, self._layout)
+        self._input_versions[i] = result_version
+        return result
+
+    def fold(self, step, i, key, fn, combine, values):
+        """Return `fn(values)` for the column `i`, where `fn(a + b)` is
+        `combine(fn(a), fn(b))` for any non-empty lists `a` and `b`.
+
+        The results are kept for the blocks of `_COLUMN_BLOCK_SIZE` values.
+
+        """
+        if not values:
+            return fn(values)
+        size = _COLUMN_BLOCK_SIZE
+        key = (key, self._input_versions.get(i, 0))
+        prev = self._folded.get((step, i))
+        if self._is_valid(prev, key, len(values)):
+            _, n, blocks, _ = prev
+            for b in {r // size for r in self.changed_rows if r < n}:
+                blocks[b] = fn(values[b * size : min(n, (b + 1) * size)])
+        else:
+            n, blocks = 0, []
+        if n % size and n < len(values):  # fill the last block
+            end = min(len(values), n + size - n % size)
+            blocks[-1] = combine(blocks[-1], fn(values[n:end]))
+            n = end
+        for start in range(n, len(values), size):
+            blocks.append(fn(values[start : start + size]))
+        self._folded[(step, i)] = (key, len(values), blocks, self._layout)
+        return reduce(combine, blocks)
+
+    def row_lines(self, key, rows, render):
+        """Return the lines of the rows of the table (pairs of a row and its vertical
+        alignment) rendered with `render(rows, start)`, where `key` are all the other
+        arguments the lines depend on.
+
+        The rows of the previous layout are the first of `rows` (rows are only
+        appended or changed), the lines of those which are padded the same are
+        reused. This is the last step of the layout, it forgets the changed rows.
+
+        """
+        rows = list(rows)
+        if self._row_lines is not None and self._row_lines[0] == key:
+            # the lines of every row, and the number of data rows up to its end
+            _, item_lines, ndatarows = self._row_lines
+            nreused = bisect_right(ndatarows, self.unchanged_rows)
+            del item_lines[nreused:], ndatarows[nreused:]
+            for r in self.changed_rows:
+                k = bisect_left(ndatarows, r + 1)
+                if k < len(item_lines):
+                    item_lines[k] = list(render(rows[k : k + 1], k))
+        else:
+            item_lines, ndatarows = [], []
+        for k in range(len(item_lines), len(rows)):
+            item_lines.append(list(render(rows[k : k + 1], k)))
+            ndatarows.append(
+                (ndatarows[-1] if ndatarows else 0) + (not _is_separating_line(rows[k][0]))
+            )
+        self._row_lines = (key, item_lines, ndatarows)
+        if self.changed_rows:
+            self._last_changed = self._layout
+            self.changed_rows = set()
+        return chain.from_iterable(item_lines)
+
+    def _is_valid(self, prev, key, nvalues):
+        """Check if a previous result can be updated for the current values: its
+        key is the same, and it was updated in all layouts with changed rows."""
+        return (
+            prev is not None
+            and prev[0] == key
+            and prev[1] <= nvalues
+            and prev[-1] >= self._last_changed
+        )
+
+    def align(self, i, strings, alignment, minwidth, flags, preserve_whitespace, width_fn):
+        """Return `_align_column(strings, alignment, minwidth, *flags, preserve_whitespace)`
+        for the column `i` and the maximal `width_fn` of the aligned strings.
+
+        Only the appended (or changed) strings are aligned if the column is as
+        wide as before (and has as many digits after the decimal point).
+
+        """
+        is_multiline = flags[2]
+        if alignment == "decimal" and is_multiline:  # the widths are not additive
+            padded = _align_column(strings, alignment, minwidth, *flags, preserve_whitespace)
+            self.unchanged_rows = 0
+            return padded, max(map(width_fn, padded))
+        measure = partial(
+            _align_column_width,
+            alignment=alignment,
+            has_invisible=flags[0],
+            enable_widechars=flags[1],
+            is_multiline=is_multiline,
+            preserve_whitespace=preserve_whitespace,
+        )
+        width, decimals = self.fold(
+            "width", i, measure.keywords, measure, _combine_column_widths, strings
+        )
+        width = max(width, minwidth)
+        pad = lambda strings: _align_column_measured(
+            strings, alignment, width, *flags, preserve_whitespace, decimals
+        )[0]
+        key = (alignment, width, decimals, flags, preserve_whitespace)
+        prev = self._mapped.get(("align", i))
+        if self._is_valid(prev, (key, self._input_versions.get(i, 0)), len(strings)):
+            self.unchanged_rows = min(self.unchanged_rows, prev[1])
+        else:
+            self.unchanged_rows = 0
+        padded = self.map("align", i, key, pad, strings)
+        colwidth = self.fold(
+            "padded width", i, flags, lambda ps: max(map(width_fn, ps)), max, padded
+        )
+        return padded, colwidth
+
+
+def _or_flags(flags1, flags2):
+    "Combine the results of `_scan_column` for two parts of a column."
+    return tuple(f1 or f2 for f1, f2 in zip(flags1, flags2))
+
+
+def _has_line_breaks(strings):
+    "Return if any of the strings has \\r or \\n."
+    return _is_multiline("\t".join(map(_to_str, strings)))
+
+
+def _tabulate_layout(
+    tabular_data,
+    headers=(),
+    tablefmt="simple",
+    floatfmt=_DEFAULT_FLOATFMT,
+    intfmt=_DEFAULT_INTFMT,
+    numalign=_DEFAULT_ALIGN,
+    stralign=_DEFAULT_ALIGN,
+    missingval=_DEFAULT_MISSINGVAL,
+    showindex="default",
+    disable_numparse=False,
+    colglobalalign=None,
+    colalign=None,
+    preserve_whitespace=False,
+    maxcolwidths=None,
+    headersglobalalign=None,
+    headersalign=None,
+    rowalign=None,
+    maxheadercolwidths=None,
+    break_long_words=_BREAK_LONG_WORDS,
+    break_on_hyphens=_BREAK_ON_HYPHENS,
+    typeinfer="full",
+    max_rows=None,
+    mincolwidths=None,
+    workers=None,
+    cache=None,
+):
+    """Compute the layout of the table for `_format_table`: padded headers and
+    cells, column widths and column alignments.
+
+    `mincolwidths` is a list of minimal column widths, it is not a part of the
+    public API and is used to render tables with fixed column widths.
+
+    `cache` is a `_ColumnCache` of a table which grows by appending rows (`Table`),
+    its columns are then processed serially, every step only for the new rows.
+
+    """
+
+    if tabular_data is None:
+        tabular_data = []
+
+    if typeinfer == "full":
+        type_sample_size = None
+    elif (
+        isinstance(typeinfer, str)
+        and typeinfer.startswith("sample:")
+        and typeinfer[7:].isdigit()
+        and int(typeinfer[7:]) >= 1
+    ):
+        type_sample_size = int(typeinfer[7:])
+    else:
+        raise ValueError(f"typeinfer must be 'full' or 'sample:N', not {typeinfer!r}")
+    if max_rows is not None and (type(max_rows) is not int or max_rows < 1):
+        raise ValueError(f"max_rows must be a positive number of rows, got {max_rows!r}")
+
+    cols, headers, headers_pad, separating_lines, known_coltypes, elided_rows = (
+        _normalize_tabular_columns(
+            tabular_data,
+            headers,
+            showindex=showindex,
+            max_rows=max_rows,
+            # alignments of single rows are moved by the number of the elided rows
+            count_elided_rows=rowalign is not None and not isinstance(rowalign, str),
+        )
+    )
+    num_cols = len(cols)
+    if cache is not None:
+        cache.start(len(cols[0]) if cols else 0)
+
+    if maxcolwidths is not None:
+        if type(maxcolwidths) is tuple:  # Check if tuple, convert to list if so
+            maxcolwidths = list(maxcolwidths)
+        if isinstance(maxcolwidths, int):  # Expand scalar for all columns
+            maxcolwidths = _expand_iterable(maxcolwidths, num_cols, maxcolwidths)
+        else:  # Ignore col width for any 'trailing' columns
+            maxcolwidths = _expand_iterable(maxcolwidths, num_cols, None)
+
+        numparses = _expand_numparse(disable_numparse, num_cols)
+        wrap_columns = [
+            partial(
+                _wrap_text_column,
+                width=width,
+                numparse=np,
+                missingval=missingval,
+                break_long_words=break_long_words,
+                break_on_hyphens=break_on_hyphens,
+            )
+            for width, np in zip(maxcolwidths, numparses)
+        ]
+        if cache is None:
+            cols = [wrap(c) for c, wrap in zip(cols, wrap_columns)]
+        else:
+            cols = [
+                cache.map("wrap", i, wrap.keywords, wrap, c)
+                for i, (c, wrap) in enumerate(zip(cols, wrap_columns))
+            ]
+
+    if maxheadercolwidths is not None:
+        num_cols = num_cols or len(headers)
+        if isinstance(maxheadercolwidths, int):  # Expand scalar for all columns
+            maxheadercolwidths = _expand_iterable(maxheadercolwidths, num_cols, maxheadercolwidths)
+        else:  # Ignore col width for any 'trailing' columns
+            maxheadercolwidths = _expand_iterable(maxheadercolwidths, num_cols, None)
+
+        numparses = _expand_numparse(disable_numparse, num_cols)
+        headers = _wrap_text_to_colwidths(
+            [headers],
+            maxheadercolwidths,
+            numparses=numparses,
+            missingval=missingval,
+            break_long_words=break_long_words,
+            break_on_hyphens=break_on_hyphens,
+        )[0]
+
+    # empty values in the first column of RST tables should be escaped (issue #82)
+    # "" should be escaped as "\\ " or ".."
+    if tablefmt == "rst" and cache is not None and cols:
+        _, headers = _rst_escape_first_column([], headers)
+        escape_first_column = lambda col: _rst_escape_first_column([col], [])[0][0]
+        cols = [cache.map("rst", 0, None, escape_first_column, cols[0])] + cols[1:]
+    elif tablefmt == "rst":
+        cols, headers = _rst_escape_first_column(cols, headers)
+
+    # PrettyTable formatting does not use any extra padding.
+    # Numbers are not parsed and are treated the same as strings for alignment.
+    # Check if pretty is the format being used and override the defaults so it
+    # does not impact other formats.
+    min_padding = MIN_PADDING
+    if tablefmt == "pretty":
+        min_padding = 0
+        disable_numparse = True
         numalign = "center" if numalign == _DEFAULT_ALIGN else numalign
         stralign = "center" if stralign == _DEFAULT_ALIGN else stralign
     else:
@@ -2307,39 +3970,51 @@ def tabulate(
         colglobalalign = "left"
         headersglobalalign = "left"
 
-    # optimization: look for ANSI control codes once,
-    # enable smart width functions only if a control code is found
-    #
-    # convert the headers and rows into a single, tab-delimited string ensuring
-    # that any bytestrings are decoded safely (i.e. errors ignored)
-    plain_text = "\t".join(
-        chain(
-            # headers
-            map(_to_str, headers),
-            # rows: chain the rows together into a single iterable after mapping
-            # the bytestring conversino to each cell value
-            chain.from_iterable(map(_to_str, row) for row in list_of_lists),
-        )
-    )
-
-    has_invisible = _ansi_codes.search(plain_text) is not None
+    # optimization: look for ANSI control codes and line breaks column by column,
+    # enable smart width functions only in the columns where they are found
+    # (numeric NumPy arrays cannot have ANSI codes or line breaks)
+    def column_strings(i):
+        col = cols[i] if i < len(cols) else []
+        return chain(headers[i : i + 1], [] if _numpy_column_type(col) is not None else col)
+
+    def check_column(i, step, fn, combine):
+        "Apply `fn` to the strings of the column `i` (only to the new values with a cache)."
+        if cache is None:
+            return fn(column_strings(i))
+        result = fn(headers[i : i + 1])
+        if i < len(cols):
+            result = combine(result, cache.fold(step, i, None, fn, combine, cols[i]))
+        return result
+
+    can_be_multiline = not isinstance(tablefmt, TableFormat) and tablefmt in multiline_formats
+    scan_column = partial(_scan_column, multiline=can_be_multiline)
+    if cache is None:
+        col_flags = [scan_column(column_strings(i)) for i in range(max(len(headers), len(cols)))]
+    else:
+        col_flags = [
+            _or_flags(
+                scan_column(headers[i : i + 1]),
+                cache.fold("scan", i, can_be_multiline, scan_column, _or_flags, c),
+            )
+            for i, c in enumerate(cols + [[]] * (len(headers) - len(cols)))
+        ]
+    col_invisible = [inv for inv, _ in col_flags]
+    has_invisible = any(col_invisible)
 
     enable_widechars = wcwidth is not None and WIDE_CHARS_MODE
-    if (
-        not isinstance(tablefmt, TableFormat)
-        and tablefmt in multiline_formats
-        and _is_multiline(plain_text)
-    ):
+    # line boundaries other than \r and \n do not make a table multiline,
+    # but in a multiline table they do break cells too
+    is_multiline = can_be_multiline and any(
+        check_column(i, "line breaks", _has_line_breaks, operator.or_)
+        for i, (_, ml) in enumerate(col_flags)
+        if ml
+    )
+    if is_multiline:
         tablefmt = multiline_formats.get(tablefmt, tablefmt)
-        is_multiline = True
-    else:
-        is_multiline = False
-    width_fn = _choose_width_fn(has_invisible, enable_widechars, is_multiline)
+    col_multiline = [is_multiline and ml for _, ml in col_flags]
 
     # format rows and columns, convert numeric values to strings
-    cols = list(izip_longest(*list_of_lists))
     numparses = _expand_numparse(disable_numparse, len(cols))
-    coltypes = [_column_type(col, numparse=np) for col, np in zip(cols, numparses)]
     if isinstance(floatfmt, str):  # old version
         float_formats = len(cols) * [floatfmt]  # just duplicate the string to use in each column
     else:  # if floatfmt is list, tuple etc we have one per column
@@ -2358,51 +4033,147 @@ def tabulate(
         missing_vals = list(missingval)
         if len(missing_vals) < len(cols):
             missing_vals.extend((len(cols) - len(missing_vals)) * [_DEFAULT_MISSINGVAL])
-    cols = [
-        [_format(v, ct, fl_fmt, int_fmt, miss_v, has_invisible) for v in c]
-        for c, ct, fl_fmt, int_fmt, miss_v in zip(
-            cols, coltypes, float_formats, int_formats, missing_vals
-        )
-    ]
+    executor = (
+        None if cache is not None else _parallel_executor(workers, sum(map(len, cols)), len(cols))
+    )
+    try:
+        if cache is not None:
+            coltypes = [
+                ct
+                if ct is not None and np
+                else cache.fold(
+                    "type",
+                    i,
+                    np,
+                    partial(_column_type, numparse=np),
+                    _more_generic,
+                    c,
+                )
+                for i, (c, ct, np) in enumerate(zip(cols, known_coltypes, numparses))
+            ]
+            cols = [
+                cache.map(
+                    "format",
+                    i,
+                    (ct, fl_fmt, int_fmt, miss_v, inv),
+                    partial(
+                        _format_column,
+                        valtype=ct,
+                        floatfmt=fl_fmt,
+                        intfmt=int_fmt,
+                        missingval=miss_v,
+                        has_invisible=inv,
+                    ),
+                    c,
+                )
+                for i, (c, ct, fl_fmt, int_fmt, miss_v, inv) in enumerate(
+                    zip(cols, coltypes, float_formats, int_formats, missing_vals, col_invisible)
+                )
+            ]
+        else:
+            typed_cols = _map_jobs(
+                executor,
+                _type_and_format_column,
+                zip(
+                    cols,
+                    known_coltypes,
+                    numparses,
+                    repeat(type_sample_size),
+                    float_formats,
+                    int_formats,
+                    missing_vals,
+                    col_invisible,
+                ),
+            )
+            coltypes = [ct for ct, _ in typed_cols]
+            cols = [c for _, c in typed_cols]
 
-    # align columns
-    # first set global alignment
-    if colglobalalign is not None:  # if global alignment provided
-        aligns = [colglobalalign] * len(cols)
-    else:  # default
-        aligns = [numalign if ct in [int, float] else stralign for ct in coltypes]
-    # then specific alignments
-    if colalign is not None:
-        assert isinstance(colalign, Iterable)
-        if isinstance(colalign, str):
-            warnings.warn(
-                f"As a string, `colalign` is interpreted as {list(colalign)}. "
-                f'Did you mean `colglobalalign = "{colalign}"` or `colalign = ("{colalign}",)`?',
-                stacklevel=2,
+        # only formatted values are aligned, the elided rows are one ellipsis row
+        if elided_rows is not None:
+            cols, separating_lines, rowalign = _insert_ellipsis_row(
+                cols, separating_lines, rowalign, elided_rows
             )
-        for idx, align in enumerate(colalign):
-            if not idx < len(aligns):
-                break
-            elif align != "global":
-                aligns[idx] = align
-    minwidths = [width_fn(h) + min_padding for h in headers] if headers else [0] * len(cols)
-    aligns_copy = aligns.copy()
-    # Reset alignments in copy of alignments list to "left" for 'colon_grid' format,
-    # which enforces left alignment in the text output of the data.
-    if tablefmt == "colon_grid":
-        aligns_copy = ["left"] * len(cols)
-    cols = [
-        _align_column(
-            c,
-            a,
-            minw,
-            has_invisible,
-            enable_widechars,
-            is_multiline,
-            preserve_whitespace,
+
+        # optimization: compute wide-character widths only in the columns
+        # with some non-ASCII (or non-printable) characters
+        col_widechars = [
+            enable_widechars and not check_column(i, "ascii", _is_printable_ascii, operator.and_)
+            for i in range(len(col_flags))
+        ]
+        width_fns = [
+            _choose_width_fn(inv, wide, ml)
+            for inv, wide, ml in zip(col_invisible, col_widechars, col_multiline)
+        ]
+
+        # align columns
+        # first set global alignment
+        if colglobalalign is not None:  # if global alignment provided
+            aligns = [colglobalalign] * len(cols)
+        else:  # default
+            aligns = [numalign if ct in [int, float] else stralign for ct in coltypes]
+        # then specific alignments
+        if colalign is not None:
+            assert isinstance(colalign, Iterable)
+            if isinstance(colalign, str):
+                warnings.warn(
+                    f"As a string, `colalign` is interpreted as {list(colalign)}. "
+                    f'Did you mean `colglobalalign = "{colalign}"` '
+                    f'or `colalign = ("{colalign}",)`?',
+                    stacklevel=3,
+                )
+            for idx, align in enumerate(colalign):
+                if not idx < len(aligns):
+                    break
+                elif align != "global":
+                    aligns[idx] = align
+        minwidths = (
+            [width_fn(h) + min_padding for h, width_fn in zip(headers, width_fns)]
+            if headers
+            else [0] * len(cols)
         )
-        for c, a, minw in zip(cols, aligns_copy, minwidths)
-    ]
+        if mincolwidths is not None:
+            mincolwidths = _expand_iterable(list(mincolwidths), len(minwidths), None)
+            minwidths = [max(minw, w or 0) for minw, w in zip(minwidths, mincolwidths)]
+        aligns_copy = aligns.copy()
+        # Reset alignments in copy of alignments list to "left" for 'colon_grid' format,
+        # which enforces left alignment in the text output of the data.
+        if tablefmt == "colon_grid":
+            aligns_copy = ["left"] * len(cols)
+        if cache is not None:
+            cols_and_widths = [
+                cache.align(i, c, a, minw, (inv, wide, ml), preserve_whitespace, width_fn)
+                for i, (c, a, minw, inv, wide, ml, width_fn) in enumerate(
+                    zip(
+                        cols,
+                        aligns_copy,
+                        minwidths,
+                        col_invisible,
+                        col_widechars,
+                        col_multiline,
+                        width_fns,
+                    )
+                )
+            ]
+            cols = [c for c, _ in cols_and_widths]
+            col_maxwidths = [w for _, w in cols_and_widths]
+        else:
+            cols = _map_jobs(
+                executor,
+                _align_column,
+                zip(
+                    cols,
+                    aligns_copy,
+                    minwidths,
+                    col_invisible,
+                    col_widechars,
+                    col_multiline,
+                    repeat(preserve_whitespace),
+                ),
+            )
+            col_maxwidths = None
+    finally:
+        if executor is not None and not isinstance(workers, (Executor, _WorkerPool)):
+            executor.shutdown()
 
     aligns_headers = None
     if headers:
@@ -2421,7 +4192,7 @@ def tabulate(
                     f"As a string, `headersalign` is interpreted as {list(headersalign)}. "
                     f'Did you mean `headersglobalalign = "{headersalign}"` '
                     f'or `headersalign = ("{headersalign}",)`?',
-                    stacklevel=2,
+                    stacklevel=3,
                 )
             for idx, align in enumerate(headersalign):
                 hidx = headers_pad + idx
@@ -2431,37 +4202,166 @@ def tabulate(
                     aligns_headers[hidx] = aligns[hidx]
                 elif align != "global":
                     aligns_headers[hidx] = align
-        minwidths = [
-            max(minw, max(width_fn(cl) for cl in c)) for minw, c in zip(minwidths, t_cols)
-        ]
+        if col_maxwidths is None or not cols:
+            col_maxwidths = [
+                max(width_fn(cl) for cl in c) for c, width_fn in zip(t_cols, width_fns)
+            ]
+        minwidths = [max(minw, w) for minw, w in zip(minwidths, col_maxwidths)]
         headers = [
-            _align_header(h, a, minw, width_fn(h), is_multiline, width_fn)
-            for h, a, minw in zip(headers, aligns_headers, minwidths)
+            _align_header(h, a, minw, width_fn(h), ml, width_fn)
+            for h, a, minw, width_fn, ml in zip(
+                headers, aligns_headers, minwidths, width_fns, col_multiline
+            )
         ]
-        rows = list(zip(*cols))
+    elif col_maxwidths is None:
+        minwidths = [max(width_fn(cl) for cl in c) for c, width_fn in zip(cols, width_fns)]
     else:
-        minwidths = [max(width_fn(cl) for cl in c) for c in cols]
-        rows = list(zip(*cols))
+        minwidths = col_maxwidths
 
     if not isinstance(tablefmt, TableFormat):
         tablefmt = _table_formats.get(tablefmt, _table_formats["simple"])
 
     ra_default = rowalign if isinstance(rowalign, str) else None
-    rowaligns = _expand_iterable(rowalign, len(rows), ra_default)
-    _reinsert_separating_lines(rows, separating_lines)
-
-    return _format_table(
-        tablefmt,
-        headers,
-        aligns_headers,
-        rows,
-        minwidths,
-        aligns,
-        is_multiline,
+    rowaligns = _expand_iterable(rowalign, len(cols[0]) if cols else 0, ra_default)
+
+    return _TableLayout(
+        fmt=tablefmt,
+        headers=headers,
+        headersaligns=aligns_headers,
+        cols=cols,
+        separating_lines=separating_lines,
+        colwidths=minwidths,
+        colaligns=aligns,
+        is_multiline=is_multiline,
         rowaligns=rowaligns,
+        coltypes=coltypes,
+        numparses=numparses,
+        float_formats=float_formats,
+        int_formats=int_formats,
+        missing_vals=missing_vals,
+        cellaligns=aligns_copy,
+        has_invisible=has_invisible,
+        enable_widechars=enable_widechars,
+        preserve_whitespace=preserve_whitespace,
     )
 
 
+def _insert_ellipsis_row(cols, separating_lines, rowalign, elided_rows):
+    """Insert a row of ellipses into formatted columns in place of the elided rows
+    (see `_normalize_tabular_columns`). Separating lines after the first rows
+    and row alignments of all rows are moved accordingly.
+
+    >>> _insert_ellipsis_row([["1", "2", "9"]], [2], ["top"] * 10, (2, 7))
+    ([['1', '2', '...', '9']], [3], ['top', 'top', None, 'top'])
+
+    """
+    nhead, nelided = elided_rows
+    cols = [c[:nhead] + [_ELLIPSIS] + c[nhead:] for c in cols]
+    if separating_lines:
+        separating_lines = [
+            lineno + 1 if lineno - i >= nhead else lineno
+            for i, lineno in enumerate(separating_lines)
+        ]
+    if rowalign is not None and not isinstance(rowalign, str):
+        rowalign = list(rowalign)
+        rowalign[nhead : nhead + nelided] = [None]
+    return cols, separating_lines, rowalign
+
+
+def _type_and_format_column(
+    col, known_type, numparse, type_sample_size, floatfmt, intfmt, missingval, has_invisible
+):
+    """Deduce the type of the column (unless it is known) and format its values.
+
+    Return the type and the formatted values.
+
+    """
+    if known_type is not None and numparse:
+        coltype = known_type
+    elif type_sample_size is None:
+        coltype = _column_type(col, numparse=numparse)
+    else:
+        coltype = _column_type_sampled(col, type_sample_size, numparse=numparse)
+    return coltype, _format_column(col, coltype, floatfmt, intfmt, missingval, has_invisible)
+
+
+def _parallel_executor(workers, ncells, njobs):
+    """Return the executor to process the columns (or the rows) of a table in,
+    or None to process them serially (see the `workers` argument of `tabulate`).
+
+    A process pool is used only for tables of at least `_PARALLEL_MIN_CELLS`
+    cells, and if there is more than one job to do.
+
+    """
+    if isinstance(workers, Executor):
+        return workers
+    if isinstance(workers, _WorkerPool):
+        return workers.executor(ncells, njobs)
+    if workers is None or (isinstance(workers, int) and workers >= 1):
+        if workers and workers > 1 and njobs > 1 and ncells >= _PARALLEL_MIN_CELLS:
+            return ProcessPoolExecutor(min(workers, njobs))
+        return None
+    raise ValueError(f"workers must be a positive int or an Executor, not {workers!r}")
+
+
+class _WorkerPool:
+    """The process pool of N workers of one `tabulate(..., workers=N)` call.
+
+    The pool is started by the first step which is worth doing in worker
+    processes (see `_parallel_executor`), the following steps reuse it.
+
+    """
+
+    def __init__(self, workers):
+        self.workers = workers
+        self._executor = None
+
+    def executor(self, ncells, njobs):
+        if self._executor is None and njobs > 1 and ncells >= _PARALLEL_MIN_CELLS:
+            self._executor = ProcessPoolExecutor(self.workers)
+        return self._executor
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+def _column_job(job):
+    "Call fn(*args) of a pickled job with the module-level settings of the calling process."
+    settings, fn, args = pickle.loads(job)
+    globals().update(settings)  # a worker process has the defaults of a fresh import
+    return fn(*args)
+
+
+def _map_jobs(executor, fn, args):
+    """Return [fn(*a) for a in args], computed in the executor if it is not None.
+
+    The jobs of a process pool are pickled before they are submitted. If the
+    arguments cannot be pickled (e.g. they contain lambdas), the jobs are done
+    serially. Other errors of the jobs or of the executor are raised.
+
+    """
+    args = list(args)
+    if executor is None or len(args) < 2:
+        return [fn(*a) for a in args]
+    if isinstance(executor, ProcessPoolExecutor):
+        settings = {
+            "WIDE_CHARS_MODE": WIDE_CHARS_MODE,
+            "TYPE_CACHE_SIZE": TYPE_CACHE_SIZE,
+            "WIDTH_CACHE_SIZE": WIDTH_CACHE_SIZE,
+        }
+        try:
+            jobs = [pickle.dumps((settings, fn, a)) for a in args]
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return [fn(*a) for a in args]
+        futures = [executor.submit(_column_job, job) for job in jobs]
+    else:
+        # threads (and other executors) share the settings of this process
+        futures = [executor.submit(fn, *a) for a in args]
+    return [f.result() for f in futures]
+
+
 def _expand_numparse(disable_numparse, column_count):
     """
     Return a list of bools of length `column_count` which indicates whether
@@ -2509,14 +4409,9 @@ def _build_simple_row(padded_cells: list[list], rowfmt: DataRow) -> str:
     begin = rowfmt.begin
     sep = rowfmt.sep
     end = rowfmt.end
-    escape_map: dict = rowfmt.escape_map
 
-    if escape_map:
-
-        def escape_char(c):
-            return escape_map.get(c, c)
-
-        escaped_cells = ["".join(map(escape_char, cell)) for cell in padded_cells]
+    if rowfmt.escape_map:
+        escaped_cells = list(map(rowfmt._escaper(), padded_cells))
     else:
         escaped_cells = padded_cells
 
@@ -2591,9 +4486,86 @@ def _build_line(colwidths, colaligns, linefmt):
         return _build_simple_row(cells, rowfmt)
 
 
-def _append_line(lines, colwidths, colaligns, linefmt):
-    lines.append(_build_line(colwidths, colaligns, linefmt))
-    return lines
+class _RenderPlan:
+    """Horizontal lines and a data row template of a table format with the given
+    (padded) column widths and alignments, compiled once and reused by every table
+    of the same layout."""
+
+    def __init__(self, fmt, padded_widths, colaligns):
+        self.fmt = fmt
+        self.padded_widths = padded_widths
+        self.colaligns = colaligns
+        self.lineabove = _build_line(padded_widths, colaligns, fmt.lineabove)
+        self.linebelowheader = _build_line(padded_widths, colaligns, fmt.linebelowheader)
+        self.linebetweenrows = _build_line(padded_widths, colaligns, fmt.linebetweenrows)
+        self.linebelow = _build_line(padded_widths, colaligns, fmt.linebelow)
+        self.separating_line = _build_line(
+            padded_widths,
+            colaligns,
+            fmt.linebetweenrows
+            or fmt.linebelowheader
+            or fmt.linebelow
+            or fmt.lineabove
+            or Line("", "", "", ""),
+        )
+        rowfmt = fmt.datarow
+        pad = " " * fmt.padding
+        if isinstance(rowfmt, DataRow) and not (rowfmt.escape_map and " " in rowfmt.escape_map):
+            # the padding is joined together with the separators
+            self._begin = rowfmt.begin + pad
+            self._sep = pad + rowfmt.sep + pad
+            self._end = pad + rowfmt.end
+            self._escaped_row = rowfmt if rowfmt.escape_map else None
+        else:
+            self._begin = None
+        self._pad = fmt.padding
+
+    def build_row(self, cells):
+        "Return a string which represents a row of (not padded) data cells."
+        if self._begin is None:
+            return _build_row(
+                _pad_row(list(cells), self._pad),
+                self.padded_widths,
+                self.colaligns,
+                self.fmt.datarow,
+            )
+        if self._escaped_row:
+            cells = list(map(self._escaped_row._escaper(), cells))
+        if not cells:
+            return (self._begin + self._end).rstrip()
+        return (self._begin + self._sep.join(cells) + self._end).rstrip()
+
+
+_render_plans = {}
+_render_plans_lock = threading.Lock()
+
+
+def _render_plan(fmt, padded_widths, colaligns):
+    """Return a (cached) render plan of the table format with the given layout.
+
+    Plans are looked up by the identity of `fmt`, so that table formats with
+    unhashable fields may be cached too.
+
+    >>> plan = _render_plan(_table_formats["grid"], [3, 5], ["left", "right"])
+    >>> plan.linebetweenrows
+    '+---+-----+'
+    >>> plan.build_row(["a", "bcd"])
+    '| a | bcd |'
+    >>> _render_plan(_table_formats["grid"], [3, 5], ["left", "right"]) is plan
+    True
+
+    """
+    key = (id(fmt), tuple(padded_widths), tuple(colaligns))
+    with _render_plans_lock:
+        plan = _render_plans.get(key)
+    if plan is None or plan.fmt is not fmt:
+        plan = _RenderPlan(fmt, list(padded_widths), list(colaligns))
+        with _render_plans_lock:
+            _render_plans.pop(key, None)
+            while len(_render_plans) >= max(_RENDER_PLAN_CACHE_SIZE, 1):
+                del _render_plans[next(iter(_render_plans))]  # the oldest one
+            _render_plans[key] = plan
+    return plan
 
 
 class JupyterHTMLStr(str):
@@ -2609,16 +4581,130 @@ class JupyterHTMLStr(str):
         return self
 
 
+@dataclass
+class _TableLayout:
+    """Padded headers and columns of a table, ready to be rendered by `_format_table`,
+    and the per-column settings which were used to format and align the cells."""
+
+    fmt: TableFormat
+    headers: list
+    headersaligns: list
+    cols: list
+    separating_lines: list
+    colwidths: list
+    colaligns: list
+    is_multiline: bool
+    rowaligns: list
+    coltypes: list
+    numparses: list
+    float_formats: list
+    int_formats: list
+    missing_vals: list
+    cellaligns: list
+    has_invisible: bool
+    enable_widechars: bool
+    preserve_whitespace: bool
+
+    def iter_rows(self):
+        """Iterate over the padded rows of the table, and the separating lines between them."""
+        rows = zip(*self.cols)
+        segments = []
+        nrows = 0
+        for nseparators, lineno in enumerate(sorted(set(self.separating_lines or ()))):
+            # rows before the separating line, and the separating line
+            segments.append(islice(rows, lineno - nseparators - nrows))
+            segments.append([SEPARATING_LINE])
+            nrows = lineno - nseparators
+        segments.append(rows)
+        return chain.from_iterable(segments)
+
+    def iter_lines(self, rows=None, rowaligns=None):
+        """Yield the lines of the table, optionally with other (already padded) rows."""
+        return _iter_table_lines(
+            self.fmt,
+            self.headers,
+            self.headersaligns,
+            self.iter_rows() if rows is None else rows,
+            self.colwidths,
+            self.colaligns,
+            self.is_multiline,
+            self.rowaligns if rowaligns is None else rowaligns,
+        )
+
+
 def _format_table(
-    fmt, headers, headersaligns, rows, colwidths, colaligns, is_multiline, rowaligns
+    fmt,
+    headers,
+    headersaligns,
+    rows,
+    colwidths,
+    colaligns,
+    is_multiline,
+    rowaligns,
+    workers=None,
+    cache=None,
 ):
     """Produce a plain-text representation of the table."""
-    lines = []
+    lines = _iter_table_lines(
+        fmt,
+        headers,
+        headersaligns,
+        rows,
+        colwidths,
+        colaligns,
+        is_multiline,
+        rowaligns,
+        workers=workers,
+        cache=cache,
+    )
+    return _join_table_lines(fmt, lines)
+
+
+def _join_table_lines(fmt, lines):
+    "Join the lines of a table of the format `fmt`."
+    output = "\n".join(lines)
+    if output and fmt.lineabove == _html_begin_table_without_header:
+        return JupyterHTMLStr(output)
+    else:
+        return output
+
+
+def _iter_table_lines(
+    fmt,
+    headers,
+    headersaligns,
+    rows,
+    colwidths,
+    colaligns,
+    is_multiline,
+    rowaligns,
+    workers=None,
+    cache=None,
+):
+    """Yield the lines of a plain-text representation of the table.
+
+    `rows` and `rowaligns` (one alignment per data row) may be lazy iterables,
+    every row is rendered as soon as it is taken from `rows`, unless the rows
+    are rendered in chunks by `workers` (see `tabulate`).
+
+    With a `_ColumnCache` of a growing table (`cache`), the lines of the rows
+    which did not change since the last layout of the table are reused.
+
+    """
+    rows = iter(rows)
+    first_row = next(rows, None)
+    if not headers and first_row is None:  # a completely empty table
+        return
+    if first_row is not None:
+        rows = chain([first_row], rows)
+    rowaligns = iter(rowaligns)
+
     hidden = fmt.with_header_hide if (headers and fmt.with_header_hide) else []
     pad = fmt.padding
     headerrow = fmt.headerrow
 
     padded_widths = [(w + 2 * pad) for w in colwidths]
+    plan = _render_plan(fmt, padded_widths, colaligns)
     if is_multiline:
         pad_row = lambda row, _: row  # noqa: E731 # do it later, in _append_multiline_row
         append_row = partial(_append_multiline_row, pad=pad)
@@ -2629,62 +4715,114 @@ def _format_table(
     padded_headers = pad_row(headers, pad)
 
     if fmt.lineabove and "lineabove" not in hidden:
-        _append_line(lines, padded_widths, colaligns, fmt.lineabove)
+        yield plan.lineabove
 
     if padded_headers:
-        append_row(lines, padded_headers, padded_widths, headersaligns, headerrow)
+        yield from append_row([], padded_headers, padded_widths, headersaligns, headerrow)
         if fmt.linebelowheader and "linebelowheader" not in hidden:
-            _append_line(lines, padded_widths, colaligns, fmt.linebelowheader)
-
-    if rows and fmt.linebetweenrows and "linebetweenrows" not in hidden:
-        # initial rows with a line below
-        for row, ralign in zip(rows[:-1], rowaligns):
-            if row != SEPARATING_LINE:
-                append_row(
-                    lines,
-                    pad_row(row, pad),
+            yield plan.linebelowheader
+
+    between = bool(fmt.linebetweenrows) and "linebetweenrows" not in hidden
+    if between and is_multiline:
+        rows = ((row, None if _is_separating_line(row) else next(rowaligns, None)) for row in rows)
+    else:
+        rows = zip(rows, repeat(None))
+
+    executor = None
+    if workers is not None and cache is None:
+        rows = list(rows)
+        nchunks = -(-len(rows) // _RENDER_CHUNK_SIZE)
+        executor = _parallel_executor(workers, len(rows) * len(colwidths), nchunks)
+    if cache is not None:
+        key = (fmt, padded_widths, colaligns, is_multiline, between)
+        render = partial(_iter_row_lines, fmt, padded_widths, colaligns, is_multiline, between)
+        yield from cache.row_lines(key, rows, render)
+    elif executor is None:
+        yield from _iter_row_lines(fmt, padded_widths, colaligns, is_multiline, between, rows)
+    else:
+        try:
+            chunks = _map_jobs(
+                executor,
+                _render_row_chunk,
+                (
+                    (
+                        fmt,
+                        padded_widths,
+                        colaligns,
+                        is_multiline,
+                        between,
+                        rows[i : i + _RENDER_CHUNK_SIZE],
+                        i,
+                    )
+                    for i in range(0, len(rows), _RENDER_CHUNK_SIZE)
+                ),
+            )
+        finally:
+            if not isinstance(workers, (Executor, _WorkerPool)):
+                executor.shutdown()
+        for lines in chunks:
+            yield from lines
+
+    if fmt.linebelow and "linebelow" not in hidden:
+        yield plan.linebelow
+
+
+def _text_width(item):
+    "Console column width of a string for text wrapping, see `_CustomTextWrap._len`."
+    stripped = _strip_ansi(item)
+    if wcwidth:
+        return _wcswidth(stripped)
+    else:
+        return len(stripped)
+
+
+def _iter_row_lines(fmt, padded_widths, colaligns, is_multiline, between, rows, start=0):
+    """Yield the lines of the data rows (and of the separating lines) of a table.
+
+    `rows` are pairs of a row and its vertical alignment, `start` is the index
+    of the first of them in the table. If `between`, a line is drawn between
+    every two rows of the table, and separating lines are drawn the same way.
+
+    """
+    plan = _render_plan(fmt, padded_widths, colaligns)
+    build_row = plan.build_row
+    if between:
+        linebetweenrows = plan.linebetweenrows
+        for i, (row, rowalign) in enumerate(rows, start):
+            if i > 0:
+                yield linebetweenrows
+            if _is_separating_line(row):
+                continue
+            elif is_multiline:
+                yield from _append_multiline_row(
+                    [],
+                    row,
                     padded_widths,
                     colaligns,
                     fmt.datarow,
-                    rowalign=ralign,
+                    pad=fmt.padding,
+                    rowalign=rowalign,
                 )
-            _append_line(lines, padded_widths, colaligns, fmt.linebetweenrows)
-        # the last row without a line below
-        append_row(
-            lines,
-            pad_row(rows[-1], pad),
-            padded_widths,
-            colaligns,
-            fmt.datarow,
-            rowalign=rowaligns[-1],
-        )
+            else:
+                yield build_row(row)
     else:
-        separating_line = (
-            fmt.linebetweenrows
-            or fmt.linebelowheader
-            or fmt.linebelow
-            or fmt.lineabove
-            or Line("", "", "", "")
-        )
-        for row in rows:
+        separating_line = plan.separating_line
+        for row, _ in rows:
             # test to see if either the 1st column or the 2nd column (account for showindex) has
             # the SEPARATING_LINE flag
             if _is_separating_line(row):
-                _append_line(lines, padded_widths, colaligns, separating_line)
+                yield separating_line
+            elif is_multiline:
+                yield from _append_multiline_row(
+                    [], row, padded_widths, colaligns, fmt.datarow, pad=fmt.padding
+                )
             else:
-                append_row(lines, pad_row(row, pad), padded_widths, colaligns, fmt.datarow)
+                yield build_row(row)
 
-    if fmt.linebelow and "linebelow" not in hidden:
-        _append_line(lines, padded_widths, colaligns, fmt.linebelow)
 
-    if headers or rows:
-        output = "\n".join(lines)
-        if fmt.lineabove == _html_begin_table_without_header:
-            return JupyterHTMLStr(output)
-        else:
-            return output
-    else:  # a completely empty table
-        return ""
+def _render_row_chunk(fmt, padded_widths, colaligns, is_multiline, between, rows, start):
+    "Return the lines of a chunk of rows of a table, see `_iter_row_lines`."
+    return list(_iter_row_lines(fmt, padded_widths, colaligns, is_multiline, between, rows, start))
 
 
 class _CustomTextWrap(textwrap.TextWrapper):
@@ -2704,11 +4842,9 @@ class _CustomTextWrap(textwrap.TextWrapper):
     def _len(item):
         """Custom len that gets console column width for wide
         and non-wide characters as well as ignores color codes"""
-        stripped = _strip_ansi(item)
-        if wcwidth:
-            return wcwidth.wcswidth(stripped)
-        else:
-            return len(stripped)
+        if WIDTH_CACHE_SIZE > 0:
+            return _cached_width(_text_width, item)
+        return _text_width(item)
 
     def _update_lines(self, lines, new_line):
         """Adds a new line to the list of lines the text is being wrapped into
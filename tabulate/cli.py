@@ -1,6 +1,13 @@
 """Command-line interface for tabulate."""
 
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from functools import partial
+import io
+from itertools import chain, islice
+import locale
+import mmap
+import os
 import re
 import sys
 import textwrap
@@ -9,9 +16,11 @@ try:
     from . import (
         _DEFAULT_FLOATFMT,
         _DEFAULT_INTFMT,
+        _STREAM_SAMPLE_SIZE,
         _is_file,
-        tabulate,
         tabulate_formats,
+        tabulate_iter,
+        write_table,
     )
 except ImportError:  # pragma: no cover
     # running as a script: python tabulate/cli.py
@@ -22,11 +31,16 @@ except ImportError:  # pragma: no cover
     from tabulate import (
         _DEFAULT_FLOATFMT,
         _DEFAULT_INTFMT,
+        _STREAM_SAMPLE_SIZE,
         _is_file,
-        tabulate,
         tabulate_formats,
+        tabulate_iter,
+        write_table,
     )
 
+# regular files of at least this size (in bytes) are read from a memory map
+_MMAP_MIN_SIZE = 16 * 1024 * 1024
+
 
 def _main():
     """\
@@ -47,6 +61,12 @@ def _main():
                               csv (comma-separated valued, Excel dialect),
                               jsonl (one JSON object per line)
     -s REGEXP, --sep REGEXP   column separator for rsv data (default: whitespace)
+    --columns COLUMNS         read only the given columns, COLUMNS can be:
+                              "1,4,7" (column numbers, for csv and rsv data),
+                              "NAME1,NAME2,..." (headers of the columns, for
+                              csv and rsv data, or keys, for jsonl data)
+    --head N                  read only the first N rows
+    --tail N                  read only the last N rows
 
     FORMAT:
     --headers HEADERS         HEADERS can be one of:
@@ -68,6 +88,17 @@ def _main():
 
     OUTPUT:
     -o FILE, --output FILE    print table to FILE (default: stdout)
+    --stream                  print every row as soon as it is read, choosing
+                              column widths from the first rows (--sample)
+                              or from the given widths (--widths)
+    --sample N                choose column widths and types from the first
+                              N rows (default: 100, or 1 with --widths);
+                              implies --stream
+    --widths W1,W2,...        widths of the columns (leave a width empty to
+                              choose it from the first rows); wider text is
+                              wrapped or truncated; implies --stream
+    -j N, --jobs N            format up to N FILEs at a time in worker processes;
+                              the tables are printed in the order of FILEs
 
     """
     import getopt
@@ -76,7 +107,7 @@ def _main():
     try:
         opts, args = getopt.getopt(
             sys.argv[1:],
-            "h1H:r:o:s:F:I:f:",
+            "h1H:r:o:s:F:I:f:j:",
             [
                 "help",
                 "header",  # deprecated in CLI > 0.10
@@ -88,6 +119,13 @@ def _main():
                 "int=",
                 "colalign=",
                 "format=",
+                "stream",
+                "sample=",
+                "widths=",
+                "jobs=",
+                "columns=",
+                "head=",
+                "tail=",
             ],
         )
     except getopt.GetoptError as e:
@@ -102,6 +140,13 @@ def _main():
     fileformat = "rsv"
     sep = r"\s+"
     outfile = "-"
+    stream = False
+    sample = None
+    colwidths = None
+    jobs = 1
+    columns = None
+    head = None
+    tail = None
     special_headers_values = ["firstrow", "keys"]
     for opt, value in opts:
         if opt in ["-1", "--header"]:
@@ -131,6 +176,45 @@ def _main():
             tablefmt = value
         elif opt in ["-s", "--sep"]:
             sep = value
+        elif opt == "--stream":
+            stream = True
+        elif opt == "--sample":
+            try:
+                sample = _positive_int(value)
+            except ValueError:
+                print(f"{value} is not a positive number of rows", file=sys.stderr)
+                print(usage)
+                sys.exit(2)
+            stream = True
+        elif opt == "--widths":
+            try:
+                colwidths = [int(w) if w.strip() else None for w in value.split(",")]
+                if any(w is not None and w < 1 for w in colwidths):
+                    raise ValueError(value)
+            except ValueError:
+                print(f"{value} is not a list of column widths", file=sys.stderr)
+                print(usage)
+                sys.exit(2)
+            stream = True
+        elif opt in ["-j", "--jobs"]:
+            try:
+                jobs = _positive_int(value)
+            except ValueError:
+                print(f"{value} is not a positive number of jobs", file=sys.stderr)
+                print(usage)
+                sys.exit(2)
+        elif opt == "--columns":
+            columns = [c.strip() for c in value.split(",")]
+        elif opt in ["--head", "--tail"]:
+            try:
+                if opt == "--head":
+                    head = _positive_int(value)
+                else:
+                    tail = _positive_int(value)
+            except ValueError:
+                print(f"{value} is not a positive number of rows", file=sys.stderr)
+                print(usage)
+                sys.exit(2)
         elif opt in ["-h", "--help"]:
             print(usage)
             sys.exit(0)
@@ -160,68 +244,226 @@ def _main():
     else:
         print(f"{fileformat} is not a supported file format")
         sys.exit(3)
+    if stream and sample is None:
+        sample = 1 if colwidths is not None else _STREAM_SAMPLE_SIZE
     # format all input files
     files = [sys.stdin] if not args else args
+    options = {
+        "headers": headers,
+        "tablefmt": tablefmt,
+        "floatfmt": floatfmt,
+        "intfmt": intfmt,
+        "colalign": colalign,
+        "sample": sample,
+        "colwidths": colwidths,
+        "columns": columns,
+        "head": head,
+        "tail": tail,
+    }
     with sys.stdout if outfile == "-" else open(outfile, "w") as out:
+        if jobs > 1 and len(files) > 1:
+            _pprint_files_in_processes(reader, files, jobs, out, options)
+            return
         for f in files:
             if f == "-":
                 f = sys.stdin
-            _open_and_pprint_file(
-                reader,
-                f,
-                headers=headers,
-                tablefmt=tablefmt,
-                floatfmt=floatfmt,
-                intfmt=intfmt,
-                file=out,
-                colalign=colalign,
-            )
+            _open_and_pprint_file(reader, f, file=out, **options)
+
+
+def _positive_int(value):
+    "Convert the value of an option to a positive int, raise ValueError if it is not."
+    n = int(value)
+    if n < 1:
+        raise ValueError(value)
+    return n
+
+
+def _pprint_files_in_processes(reader, files, jobs, file, options):
+    """Format the files in `jobs` worker processes, and print their tables in
+    the order of the files. Standard input ("-") is read in this process."""
+    with ProcessPoolExecutor(jobs) as executor:
+        pending = deque()  # formatted tables to print, in the order of the files
+        for f in files:
+            if f == "-":
+                _print_formatted_files(pending, file, 0)
+                _open_and_pprint_file(reader, sys.stdin, file=file, **options)
+            else:
+                pending.append(executor.submit(_format_file, reader, f, options))
+                # keep at most two tables per worker in memory
+                _print_formatted_files(pending, file, 2 * jobs)
+        _print_formatted_files(pending, file, 0)
+
+
+def _print_formatted_files(pending, file, nkept):
+    "Print the first formatted tables, until only `nkept` tables are pending."
+    while len(pending) > nkept:
+        file.write(pending.popleft().result())
+        file.flush()
+
+
+def _format_file(reader, f, options):
+    "Return the output of `_open_and_pprint_file` for a file as a string."
+    buf = io.StringIO()
+    _open_and_pprint_file(reader, f, file=buf, **options)
+    return buf.getvalue()
 
 
 def _read_rsv_file(fobject, sep):
-    rows = fobject.readlines()
-    table = [re.split(sep, r.rstrip()) for r in rows if r.strip()]
-    return table
+    "Yield the non-empty lines of a file split by the regular expression `sep`."
+    split = re.compile(sep).split
+    for line in fobject:
+        if line.strip():
+            yield split(line.rstrip())
 
 
 def _read_jsonl_file(fobject):
+    "Yield the JSON objects of a file, one per line."
     import json
 
-    rows: list[str] = fobject.readlines()
-    table = [json.loads(row) for row in rows]
-    return table
+    for line in fobject:
+        yield json.loads(line)
 
 
 def _read_csv_file(fobject):
+    "Yield the rows of a CSV file (Excel dialect) as lists of strings."
     import csv
 
-    reader = csv.reader(fobject, dialect="excel")
-    table = [list(row) for row in reader]
-    return table
+    yield from csv.reader(fobject, dialect="excel")
 
 
 def _open_and_pprint_file(reader, f, *args, **kwargs):
     if _is_file(f):
         _pprint_file(reader, f, *args, **kwargs)
+    elif os.path.isfile(f) and os.path.getsize(f) >= _MMAP_MIN_SIZE:
+        # big files are not copied into a file buffer, only the lines being read are
+        with open(f, "rb") as fobj:
+            lines = _iter_mmap_lines(fobj, locale.getpreferredencoding(False))
+            _pprint_file(reader, lines, *args, **kwargs)
     else:
         with open(f) as fobj:
             _pprint_file(reader, fobj, *args, **kwargs)
 
 
-def _pprint_file(reader, fobject, headers, tablefmt, floatfmt, intfmt, file, colalign):
+def _iter_mmap_lines(fobject, encoding):
+    """Yield the lines of a binary file from a memory map of the file, decoded
+    one at a time, with "\\r\\n" line endings translated to "\\n"."""
+    with mmap.mmap(fobject.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        for line in iter(buf.readline, b""):
+            if line.endswith(b"\r\n"):
+                line = line[:-2] + b"\n"
+            yield line.decode(encoding)
+
+
+def _pprint_file(
+    reader,
+    fobject,
+    headers,
+    tablefmt,
+    floatfmt,
+    intfmt,
+    file,
+    colalign,
+    sample=None,
+    colwidths=None,
+    columns=None,
+    head=None,
+    tail=None,
+):
     table = reader(fobject)
-    print(
-        tabulate(
+    if columns is not None:
+        table, headers = _select_columns(table, columns, headers)
+    if head is not None or tail is not None:
+        table = _select_rows(table, head, tail, 1 if headers == "firstrow" else 0)
+    if sample is not None:
+        # a streamed table, every line is printed as soon as it is rendered
+        lines = tabulate_iter(
             table,
             headers,
             tablefmt,
+            sample=sample,
+            colwidths=colwidths,
             floatfmt=floatfmt,
             intfmt=intfmt,
             colalign=colalign,
-        ),
-        file=file,
+        )
+        empty = True
+        for line in lines:
+            file.write(line + "\n")
+            file.flush()
+            empty = False
+        if empty:
+            file.write("\n")
+        return
+    write_table(
+        file,
+        table,
+        headers,
+        tablefmt,
+        floatfmt=floatfmt,
+        intfmt=intfmt,
+        colalign=colalign,
     )
 
 
+def _select_columns(rows, columns, headers):
+    """Keep only the given columns of the rows, as soon as every row is read.
+
+    `columns` are column numbers (starting from 1) or headers of the columns
+    (from the first row if headers="firstrow"), or keys of dicts. Return the
+    rows and the headers of the columns, in the order of `columns`.
+
+    Headers of fewer columns than the first row has are the headers of the
+    last columns (as in `tabulate`).
+
+    """
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None:
+        return rows, headers
+    if hasattr(first, "keys") and hasattr(first, "values"):  # JSON objects
+        rows = chain([first], rows)
+        return ({k: row.get(k) for k in columns} for row in rows), headers
+    if headers == "firstrow":
+        names, first = list(first), next(rows, None)
+    else:
+        names = [] if headers == "keys" else list(headers)
+    ncols = max(len(names), len(first) if first is not None else 0)
+    offset = ncols - len(names)
+    indices = []
+    for c in columns:
+        if c in names:
+            indices.append(offset + names.index(c))
+        elif c.isdigit() and 1 <= int(c) <= ncols:
+            indices.append(int(c) - 1)
+        elif c.isdigit() and int(c) > ncols:
+            print(f"there is no column {c}, the table has {ncols} columns", file=sys.stderr)
+            sys.exit(2)
+        else:
+            print(f"{c} is not a column number or a column header", file=sys.stderr)
+            sys.exit(2)
+    selected_names = [names[i - offset] if i >= offset else "" for i in indices]
+    rows = ([row[i] if i < len(row) else None for i in indices] for row in rows)
+    if first is not None:
+        rows = chain([[first[i] if i < len(first) else None for i in indices]], rows)
+    if headers == "firstrow":
+        rows = chain([selected_names], rows)
+    elif headers != "keys":
+        headers = selected_names if headers else []
+    return rows, headers
+
+
+def _select_rows(rows, head, tail, nfirst):
+    """Keep only the first `head` rows and then the last `tail` rows (if not None)
+    after the first `nfirst` rows. Rows after the first `head` rows are not read,
+    and only `tail` rows are kept in memory."""
+    rows = iter(rows)
+    first = list(islice(rows, nfirst))
+    if head is not None:
+        rows = islice(rows, head)
+    if tail is not None:
+        rows = deque(rows, maxlen=tail)
+    return chain(first, rows)
+
+
 if __name__ == "__main__":  # pragma: no cover
     _main()
@@ -1,6 +1,18 @@
 """API properties."""
 
-from tabulate import simple_separated_format, tabulate, tabulate_formats
+from tabulate import (
+    Table,
+    paginate,
+    simple_separated_format,
+    tabulate,
+    tabulate_formats,
+    tabulate_iter,
+    type_cache_clear,
+    type_cache_info,
+    width_cache_clear,
+    width_cache_info,
+    write_table,
+)
 
 from common import skip
 
@@ -56,12 +68,82 @@ def test_tabulate_signature():
         ("maxheadercolwidths", None),
         ("break_long_words", True),
         ("break_on_hyphens", True),
+        ("typeinfer", "full"),
+        ("max_rows", None),
+        ("workers", None),
     ]
     _check_signature(tabulate, expected_sig)
 
 
+def test_tabulate_iter_signature():
+    "API: tabulate_iter() accepts the same arguments as tabulate()"
+    assert type(tabulate_iter) is type(lambda: None)
+    expected_sig = [
+        ("tabular_data", _empty),
+        ("headers", ()),
+        ("tablefmt", "simple"),
+        ("sample", None),
+        ("colwidths", None),
+        ("kwargs", _empty),
+    ]
+    _check_signature(tabulate_iter, expected_sig)
+
+
+def test_write_table_signature():
+    "API: write_table() accepts a file and the same arguments as tabulate()"
+    assert type(write_table) is type(lambda: None)
+    expected_sig = [
+        ("file", _empty),
+        ("tabular_data", _empty),
+        ("headers", ()),
+        ("tablefmt", "simple"),
+        ("kwargs", _empty),
+    ]
+    _check_signature(write_table, expected_sig)
+
+
 def test_simple_separated_format_signature():
     "API: simple_separated_format() type signature is unchanged"
     assert type(simple_separated_format) is type(lambda: None)
     expected_sig = [("separator", _empty)]
     _check_signature(simple_separated_format, expected_sig)
+
+
+def test_type_cache_info_signature():
+    "API: type_cache_info() and type_cache_clear() take no arguments"
+    assert type(type_cache_info) is type(lambda: None)
+    _check_signature(type_cache_info, [])
+    assert type(type_cache_clear) is type(lambda: None)
+    _check_signature(type_cache_clear, [])
+
+
+def test_paginate_signature():
+    "API: paginate() accepts the same arguments as tabulate()"
+    assert type(paginate) is type(lambda: None)
+    expected_sig = [
+        ("tabular_data", _empty),
+        ("page_size", _empty),
+        ("headers", ()),
+        ("tablefmt", "simple"),
+        ("kwargs", _empty),
+    ]
+    _check_signature(paginate, expected_sig)
+
+
+def test_table_signature():
+    "API: Table() accepts the same arguments as tabulate()"
+    expected_sig = [
+        ("rows", ()),
+        ("headers", ()),
+        ("tablefmt", "simple"),
+        ("options", _empty),
+    ]
+    _check_signature(Table, expected_sig)
+
+
+def test_width_cache_info_signature():
+    "API: width_cache_info() and width_cache_clear() take no arguments"
+    assert type(width_cache_info) is type(lambda: None)
+    _check_signature(width_cache_info, [])
+    assert type(width_cache_clear) is type(lambda: None)
+    _check_signature(width_cache_clear, [])
@@ -2,13 +2,15 @@
 
 import contextlib
 import io
+from itertools import islice, repeat
 import os
 import subprocess
 import sys
 import tempfile
 from unittest.mock import patch
 
-from tabulate.cli import _main
+import tabulate.cli
+from tabulate.cli import _main, _read_csv_file, _read_jsonl_file, _read_rsv_file
 
 from common import assert_equal
 
@@ -398,6 +400,12 @@ def test_inprocess_csv_from_stdin():
     assert_equal(out.splitlines(), SAMPLE_CSV_FORMAT.splitlines())
 
 
+def test_inprocess_empty_input():
+    """In-process: an empty input prints an empty line, also with --stream"""
+    for args in [[], ["--stream"]]:
+        assert_equal("\n", run_main_in_process(args, input_text=""))
+
+
 def test_inprocess_invalid_option():
     """In-process: unrecognised option exits with code 2"""
     import pytest
@@ -483,3 +491,170 @@ def test_inprocess_jsonl_malformed_headers():
     )
     # output should still be produced (graceful fallback), with raw keys as headers
     assert out.strip() != ""
+
+
+def test_readers_are_lazy():
+    """Command line utility: input rows are parsed one line at a time"""
+    rows = _read_rsv_file(repeat("a  b\n"), r"\s+")
+    assert_equal([["a", "b"]] * 2, list(islice(rows, 2)))
+    rows = _read_csv_file(repeat('a,"b,c"\n'))
+    assert_equal([["a", "b,c"]] * 2, list(islice(rows, 2)))
+    rows = _read_jsonl_file(repeat('{"a": 1}\n'))
+    assert_equal([{"a": 1}] * 2, list(islice(rows, 2)))
+
+
+def test_inprocess_stream_option():
+    """In-process: --stream / --sample / --widths"""
+    # the widths of the columns are chosen from the first row
+    expected = "\n".join(
+        [
+            "---  ------  ----------",
+            "Sun  696000  1.9891e+09",
+            "Ear    6371      5973.6",
+            "th",
+            "Moo    1737        73.5",
+            "n",
+            "Mar    3390      641.85",
+            "s",
+            "---  ------  ----------",
+        ]
+    )
+    for args in [["--stream", "--sample", "1"], ["--sample", "1"], ["--widths", "3,,"]]:
+        out = run_main_in_process(args, input_text=sample_input())
+        assert_equal(out.splitlines(), expected.splitlines())
+    out = run_main_in_process(["--stream"], input_text=sample_input())
+    assert_equal(out.splitlines(), SAMPLE_SIMPLE_FORMAT.splitlines())
+
+
+class _LiveInput(io.StringIO):
+    """StringIO that checks the output written before every line is read."""
+
+    def __init__(self, lines, check):
+        super().__init__("".join(lines))
+        self.nlines = 0
+        self.check = check
+
+    def __next__(self):
+        self.check(self.nlines)
+        self.nlines += 1
+        return super().__next__()
+
+
+def test_inprocess_stream_prints_rows_as_they_are_read():
+    """In-process: --stream prints a row before the next row is read"""
+    stdout = _UnclosableStringIO()
+
+    def check(nlines):
+        # every row read so far is printed
+        assert len(stdout.getvalue().splitlines()) == nlines
+
+    stdin = _LiveInput(["a 1\n", "b 2\n", "c 3\n"], check)
+    with (
+        patch("sys.argv", ["tabulate", "--sample", "1", "-f", "plain"]),
+        patch("sys.stdin", stdin),
+        contextlib.redirect_stdout(stdout),
+    ):
+        _main()
+    assert_equal(["a  1", "b  2", "c  3"], stdout.getvalue().splitlines())
+
+
+def test_inprocess_mmap_file(monkeypatch):
+    """In-process: big files are read from a memory map"""
+    monkeypatch.setattr(tabulate.cli, "_MMAP_MIN_SIZE", 1)
+    with TemporaryTextFile() as input_file:
+        input_file.write(sample_input().replace("\n", "\r\n"))
+        input_file.flush()
+        out = run_main_in_process([input_file.name])
+        assert_equal(out.splitlines(), SAMPLE_SIMPLE_FORMAT.splitlines())
+    with TemporaryTextFile() as input_file:
+        input_file.write(SAMPLE_INPUT_CSV)
+        input_file.flush()
+        out = run_main_in_process(["-r", "csv", input_file.name])
+        assert_equal(out.splitlines(), SAMPLE_CSV_FORMAT.splitlines())
+
+
+def test_inprocess_jobs_option():
+    """In-process: -j / --jobs prints the tables of the files in their order"""
+    with TemporaryTextFile() as file1, TemporaryTextFile() as file2:
+        file1.write(sample_input())
+        file1.flush()
+        file2.write(sample_input(with_headers=True))
+        file2.flush()
+        args = ["-f", "grid", file1.name, "-", file2.name, file1.name]
+        expected = run_main_in_process(args, input_text="a 1\n")
+        for opt in ["-j", "--jobs"]:
+            out = run_main_in_process([opt, "2"] + args, input_text="a 1\n")
+            assert_equal(out.splitlines(), expected.splitlines())
+
+
+def test_inprocess_columns_option():
+    """In-process: --columns selects columns by numbers or by headers"""
+    expected = "\n".join(
+        [
+            "         Mass  Planet",
+            "-------------  --------",
+            "   1.9891e+09  Sun",
+            "5973.6         Earth",
+            "  73.5         Moon",
+            " 641.85        Mars",
+        ]
+    )
+    for columns in ["3,1", "Mass,Planet", "3,Planet"]:
+        args = ["-1", "--columns", columns]
+        out = run_main_in_process(args, input_text=sample_input(with_headers=True))
+        assert_equal(out.splitlines(), expected.splitlines())
+    args = ["--headers", "Planet,Radius,Mass", "--columns", "Mass,1"]
+    out = run_main_in_process(args, input_text=sample_input())
+    assert_equal(out.splitlines(), expected.splitlines())
+    out = run_main_in_process(
+        ["-r", "jsonl", "--columns", "name,id"], input_text=SAMPLE_INPUT_JSONL
+    )
+    assert_equal(out.splitlines()[0].split(), ["name", "id"])
+
+
+def test_inprocess_columns_option_order_and_short_headers():
+    """In-process: --columns keeps its order and maps short header rows to the last columns"""
+    jsonl = '{"id": 1, "email": "alice@example.com"}\n{"id": 2, "name": "Bob"}'
+    out = run_main_in_process(["-r", "jsonl", "--columns", "name,id"], input_text=jsonl)
+    assert_equal(out.splitlines()[0].split(), ["name", "id"])
+    assert_equal(out.splitlines()[3].split(), ["Bob", "2"])
+    # a header row of two names for rows of three values names the last two columns
+    text = "Radius Mass\n" + sample_input()
+    out = run_main_in_process(["-1", "-f", "plain", "--columns", "Mass,1"], input_text=text)
+    assert_equal(out.splitlines()[:2], ["         Mass", "   1.9891e+09  Sun"])
+    out = run_main_in_process(
+        ["--headers", "Radius,Mass", "-f", "plain", "--columns", "Radius"], sample_input()
+    )
+    assert_equal(out.splitlines()[:2], ["  Radius", "  696000"])
+
+
+def test_inprocess_columns_option_out_of_range():
+    """In-process: --columns with a column number past the last column exits with code 2"""
+    import pytest
+
+    for args in [["--columns", "4"], ["-1", "--columns", "Mass,5"], ["--columns", "0"]]:
+        with pytest.raises(SystemExit) as exc_info:
+            run_main_in_process(args, input_text=sample_input(with_headers=True))
+        assert exc_info.value.code == 2
+
+
+def test_inprocess_head_and_tail_options():
+    """In-process: --head and --tail select the first or the last rows"""
+    out = run_main_in_process(["-1", "--tail", "2"], input_text=sample_input(with_headers=True))
+    assert_equal(out.splitlines()[2:], ["Moon          1737   73.5", "Mars          3390  641.85"])
+    out = run_main_in_process(["--head", "3", "--tail", "1", "-f", "plain"], sample_input())
+    assert_equal(out.splitlines(), ["Moon  1737  73.5"])
+    # no rows are read after the first rows
+    stdout = _UnclosableStringIO()
+
+    def check(nlines):
+        assert nlines < 2
+
+    stdin = _LiveInput(sample_input().splitlines(keepends=True), check)
+    with (
+        patch("sys.argv", ["tabulate", "--head", "2", "-f", "plain"]),
+        patch("sys.stdin", stdin),
+        contextlib.redirect_stdout(stdout),
+    ):
+        _main()
+    assert_equal(2, len(stdout.getvalue().splitlines()))
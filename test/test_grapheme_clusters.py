@@ -280,3 +280,28 @@ class TestVisibleWidthFallback:
             result = _visible_width(colored_wide)
 
         assert result == 4
+
+
+class TestAsciiWidthShortcut:
+    """Tests that printable ASCII text is measured without calling wcwidth."""
+
+    @requires_wcwidth
+    def test_ascii_columns_skip_wcswidth(self):
+        """Only the columns with non-ASCII characters are measured with wcswidth()."""
+        import tabulate as tabulate_module
+
+        data = [["中文", "abc", 1.5], ["x", "tab", 22]]
+        with mock.patch.object(
+            tabulate_module.wcwidth, "wcswidth", side_effect=wcwidth.wcswidth
+        ) as wcswidth:
+            result = tabulate(data, headers=["name", "text", "num"], tablefmt="grid")
+        assert {call.args[0].strip() for call in wcswidth.call_args_list} == {"中文"}
+        assert len({tabulate_module._visible_width(line) for line in result.split("\n")}) == 1
+
+    @requires_wcwidth
+    def test_non_printable_ascii_is_measured_with_wcswidth(self):
+        """ASCII strings with control characters are still measured by wcswidth()."""
+        from tabulate import _wcswidth
+
+        for s in ["", "abc", "a\tb", "a\x07", "中文"]:
+            assert _wcswidth(s) == wcwidth.wcswidth(s)
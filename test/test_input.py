@@ -292,6 +292,94 @@ def test_pandas_keys():
         skip("test_pandas_keys is skipped")
 
 
+def test_pandas_column_dtypes():
+    "Input: a Pandas DataFrame keeps the types of its columns."
+    try:
+        import pandas
+
+        df = pandas.DataFrame(
+            {
+                "int": [1, 2],
+                "float": [1.5, 2.25],
+                "bool": [True, False],
+                "uint": pandas.Series([3, 4], dtype="uint8"),
+            }
+        )
+        expected = "\n".join(
+            [
+                "      int    float  bool      uint",
+                "--  -----  -------  ------  ------",
+                " 0      1     1.50  True         3",
+                " 1      2     2.25  False        4",
+            ]
+        )
+        result = tabulate(df, headers="keys", floatfmt=".2f")
+        assert_equal(expected, result)
+    except ImportError:
+        skip("test_pandas_column_dtypes is skipped")
+
+
+def test_pandas_extension_dtypes():
+    "Input: a Pandas DataFrame with nullable, categorical and datetime columns."
+    try:
+        import pandas
+
+        df = pandas.DataFrame(
+            {
+                "n": pandas.array([1, None, 3], dtype="Int64"),
+                "cat": pandas.Categorical(["10", "2", None]),
+                "when": pandas.to_datetime(["2024-01-01 00:00", None, "2024-01-03 12:00"]),
+            }
+        )
+        expected = "\n".join(
+            [
+                "      n    cat  when",
+                "--  ---  -----  -------------------",
+                " 0    1     10  2024-01-01 00:00:00",
+                " 1           2  -",
+                " 2    3    n/a  2024-01-03 12:00:00",
+            ]
+        )
+        result = tabulate(df, headers="keys", missingval=["", "", "n/a", "-"])
+        assert_equal(expected, result)
+        # categories of integers with missing values are still integers
+        df = pandas.DataFrame({"cat": pandas.Categorical([1000, 2000, None])})
+        expected = "\n".join(["  cat", "-----", "1,000", "2,000", "    -"])
+        result = tabulate(df, headers="keys", showindex=False, intfmt=",", missingval="-")
+        assert_equal(expected, result)
+        empty = pandas.DataFrame({"cat": pandas.Categorical([None, None])})
+        assert_equal("cat\n-----\n-\n-", tabulate(empty, "keys", showindex=False, missingval="-"))
+    except ImportError:
+        skip("test_pandas_extension_dtypes is skipped")
+
+
+def test_pandas_text_missing_values():
+    "Input: missing values of text columns of a Pandas DataFrame are shown like NaN."
+    try:
+        import numpy
+        import pandas
+
+        df = pandas.DataFrame(
+            {
+                "f": [1.5, numpy.nan],
+                "s": pandas.Series(["x", numpy.nan], dtype="str"),
+                "o": pandas.Series(["y", numpy.nan], dtype=object),
+            }
+        )
+        expected = "\n".join(
+            [
+                "        f  s    o",
+                "--  -----  ---  ---",
+                " 0    1.5  x    y",
+                " 1  nan    nan  nan",
+            ]
+        )
+        result = tabulate(df, headers="keys", missingval="?")
+        assert_equal(expected, result)
+    except ImportError:
+        skip("test_pandas_text_missing_values is skipped")
+
+
 def test_sqlite3():
     "Input: an sqlite3 cursor"
     try:
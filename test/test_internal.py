@@ -355,3 +355,257 @@ def test__reinsert_separating_lines():
     expected = rows_to_pipe_table_str(with_rows)
 
     assert_equal(expected, rows_to_pipe_table_str(sans_rows))
+
+
+def test_normalize_tabular_columns_dict_of_lists():
+    "Internal: _normalize_tabular_columns() uses lists of a dict as columns without copying"
+    a, b = [1, 2, 3], ["x", "y"]
+    cols, headers, headers_pad, _separating_lines, _, _ = T._normalize_tabular_columns(
+        {"a": a, "b": b}, "keys"
+    )
+    assert cols[0] is a
+    assert_equal([["x", "y", None]], cols[1:])
+    assert_equal(["a", "b"], headers)
+    assert_equal(0, headers_pad)
+
+
+def test_normalize_tabular_columns_rows():
+    "Internal: _normalize_tabular_columns() transposes rows and removes separating lines"
+    rows = [["a", "b"], [1, 2], T.SEPARATING_LINE, [3]]
+    cols, headers, headers_pad, separating_lines, _, _ = T._normalize_tabular_columns(
+        rows, "firstrow", showindex="always"
+    )
+    assert_equal([[0, 1], (1, 3), (2, None)], cols)
+    assert_equal(["", "a", "b"], headers)
+    assert_equal(1, headers_pad)
+    assert_equal([1], separating_lines)
+
+
+def test_normalize_tabular_columns_numpy_2d():
+    "Internal: _normalize_tabular_columns() uses views of a 2D NumPy array as columns"
+    try:
+        import numpy
+
+        na = numpy.arange(6).reshape((3, 2))
+        cols, headers, _, _, _, _ = T._normalize_tabular_columns(na, "firstrow")
+        assert_equal(["0", "1"], headers)
+        assert_equal([[2, 4], [3, 5]], [c.tolist() for c in cols])
+        assert all(numpy.shares_memory(c, na) for c in cols)
+    except ImportError:
+        skip("test_normalize_tabular_columns_numpy_2d is skipped")
+
+
+def test_numpy_column_type():
+    "Internal: _numpy_column_type() takes the column type from the dtype"
+    try:
+        import numpy
+
+        assert T._numpy_column_type(numpy.array([1, 2], dtype=numpy.int8)) is int
+        assert T._numpy_column_type(numpy.array([1.5, numpy.nan])) is float
+        assert T._numpy_column_type(numpy.array([1, 2], dtype=numpy.uint32)) is float
+        assert T._numpy_column_type(numpy.array([True, False])) is float
+        assert T._numpy_column_type(numpy.array(["1", "2"])) is None
+        assert T._numpy_column_type(numpy.array([1, None], dtype=object)) is None
+        assert T._numpy_column_type(numpy.ma.masked_array([1, 2], mask=[0, 1])) is None
+    except ImportError:
+        skip("test_numpy_column_type is skipped")
+
+
+def test_format_column_numpy():
+    "Internal: _format_column() formats NumPy arrays like _format() formats their values"
+    try:
+        import numpy
+
+        columns = [
+            (numpy.array([1, -22, 3000]), int),
+            (numpy.array([0.5, -1.25, 1e100, numpy.nan]), float),
+            (numpy.array([1, 2**64 - 1], dtype=numpy.uint64), float),
+            (numpy.array([0.1, 2.5], dtype=numpy.float32), float),
+        ]
+        for column, coltype in columns:
+            for floatfmt, intfmt in [("g", ""), (".2f", ","), ("+08.3e", "05d"), ("%", "#x")]:
+                expected = [T._format(v, coltype, floatfmt, intfmt) for v in column]
+                result = T._format_column(column, coltype, floatfmt, intfmt)
+                assert_equal(expected, result)
+    except ImportError:
+        skip("test_format_column_numpy is skipped")
+
+
+def test_column_type_cache():
+    "Internal: _column_type() remembers types of repeated strings"
+    T.type_cache_clear()
+    column = ["1", "2", "1", b"1", "\x1b[31m1\x1b[0m", "1", 1, 1]
+    assert T._column_type(column) is int
+    assert_equal((2, 4), T.type_cache_info()[:2])
+    assert T._column_type(["1", "1", "x", "1"], numparse=False) is str
+    assert_equal((4, 6), T.type_cache_info()[:2])
+    T.type_cache_clear()
+    assert_equal((0, 0), T.type_cache_info()[:2])
+
+
+def test_column_type_sampled_cache():
+    "Internal: _column_type_sampled() checks repeated strings once"
+    T.type_cache_clear()
+    column = ["1.500", "2.250"] * 50
+    assert T._column_type_sampled(column, 2) is float
+    # 2 strings of the sample, then 2 checked strings and 98 repeated ones
+    assert_equal((98, 4), T.type_cache_info()[:2])
+    assert T._column_type_sampled(["1", "2"] * 10 + ["2.5", "1", "x"], 2) is str
+
+
+def test_column_type_cache_size(monkeypatch):
+    "Internal: _column_type() remembers types of at most TYPE_CACHE_SIZE strings"
+    monkeypatch.setattr(T, "TYPE_CACHE_SIZE", 1)
+    T.type_cache_clear()
+    assert T._column_type(["1", "2", "2", "1"]) is int
+    assert_equal((1, 3, 1), tuple(T.type_cache_info()))
+    monkeypatch.setattr(T, "TYPE_CACHE_SIZE", 0)
+    T.type_cache_clear()
+    assert T._column_type(["1", "1"]) is int
+    assert_equal((0, 2, 0), tuple(T.type_cache_info()))
+
+
+def test_width_cache(monkeypatch):
+    "Internal: visible widths are remembered across tables if WIDTH_CACHE_SIZE > 0"
+    table = [["\x1b[31mred\x1b[0m", "中文"], ["x", "中文"]]
+    expected = T.tabulate(table)
+    monkeypatch.setattr(T, "WIDTH_CACHE_SIZE", 100)
+    T.width_cache_clear()
+    assert_equal(expected, T.tabulate(table))
+    hits, misses, maxsize, currsize = T.width_cache_info()
+    assert_equal((100, misses), (maxsize, currsize))
+    assert_equal(expected, T.tabulate(table))
+    assert_equal((misses, maxsize, currsize), tuple(T.width_cache_info())[1:])
+    assert T.width_cache_info().hits > hits
+    T.width_cache_clear()
+    assert_equal((0, 0, 100, 0), tuple(T.width_cache_info()))
+
+
+def test_width_cache_size(monkeypatch):
+    "Internal: the least recently used widths are evicted from the width cache"
+    monkeypatch.setattr(T, "WIDTH_CACHE_SIZE", 2)
+    T.width_cache_clear()
+    for s in ["a", "b", "a", "c", "b"]:
+        assert_equal(1, T._cached_width(T._visible_width, s))
+    assert_equal((1, 4, 2, 2), tuple(T.width_cache_info()))
+    keys = [key[0] for key in T._width_cache]
+    assert_equal(["c", "b"], keys)
+    T.width_cache_clear()
+
+
+def test_column_type_sampled():
+    "Internal: _column_type_sampled() deduces the same types as _column_type()"
+    columns = [
+        ["1", "2", "3", "4", "5", "6.5"],
+        [1, 2, 3, None, "", "True"],
+        ["1", "2", "3", "4", "1e400"],
+        ["1", "2", "3", "4", "1,000"],
+        ["1", "2", "3", "4", b"5"],
+        [True, False, True, "False", "1"],
+        [0.5, 1.5, 2.5, 3.5, "\x1b[31m4.5\x1b[0m"],
+        [1, 2, 3, 4, 5, "nan"],
+        ["1", "2", "3", "4", "5", "x"],
+    ]
+    for column in columns:
+        for numparse in [True, False]:
+            expected = T._column_type(column, numparse=numparse)
+            for sample_size in [1, 2, 3]:
+                result = T._column_type_sampled(column, sample_size, numparse=numparse)
+                assert_equal(expected, result)
+
+
+def test_classify_string():
+    "Internal: _classify_string() recognizes common forms of numbers and booleans"
+    cases = [
+        ("42", ("int", -1)),
+        ("-0042", ("int", -1)),
+        ("1,234", ("thousands_int", -1)),
+        ("3.25", ("float", 2)),
+        (".5", ("float", 1)),
+        ("1.", ("float", 0)),
+        ("1e-5", ("float", 2)),
+        ("1,234.", ("thousands_float", 0)),
+        ("True", ("bool", -1)),
+        ("1,23", None),
+        (" 42", None),
+        ("inf", None),
+        ("\x1b[31m42\x1b[0m", None),
+        ("", None),
+    ]
+    for string, expected in cases:
+        assert_equal(expected, T._classify_string(string))
+
+
+def test_classify_string_type_and_afterpoint():
+    "Internal: _type() and _afterpoint() of classified strings"
+    cases = [
+        ("0", int, -1),
+        ("-12", int, -1),
+        ("1,000", int, -1),
+        ("+3.5", float, 1),
+        ("1,000.25", float, 2),
+        ("1.5E+10", float, 5),
+        ("7.", float, 0),
+        ("False", bool, -1),
+    ]
+    for string, expected_type, expected_afterpoint in cases:
+        assert T._classify_string(string) is not None
+        assert_equal(expected_type, T._type(string))
+        assert_equal(str if expected_type is not bool else bool, T._type(string, numparse=False))
+        assert_equal(expected_afterpoint, T._afterpoint(string))
+
+
+def test_render_plan_reuse():
+    "Internal: _render_plan() is reused for tables with the same format and layout"
+    fmt = T._table_formats["grid"]
+    plan = T._render_plan(fmt, [3, 4], ["left", "right"])
+    assert T._render_plan(fmt, [3, 4], ["left", "right"]) is plan
+    assert T._render_plan(fmt, [3, 5], ["left", "right"]) is not plan
+    assert T._render_plan(T._table_formats["simple"], [3, 4], ["left", "right"]) is not plan
+    assert_equal("+---+----+", plan.lineabove)
+    assert_equal("+===+====+", plan.linebelowheader)
+    assert_equal("| a | bc |", plan.build_row(("a", "bc")))
+
+
+def test_render_plan_cache_size(monkeypatch):
+    "Internal: the number of cached render plans is bounded"
+    monkeypatch.setattr(T, "_RENDER_PLAN_CACHE_SIZE", 2)
+    monkeypatch.setattr(T, "_render_plans", {})
+    fmt = T._table_formats["grid"]
+    for width in range(5):
+        T._render_plan(fmt, [width], ["left"])
+    assert_equal(2, len(T._render_plans))
+
+
+def test_render_plan_cache_threads(monkeypatch):
+    "Internal: render plans may be cached and evicted by concurrent threads"
+    from concurrent.futures import ThreadPoolExecutor
+
+    monkeypatch.setattr(T, "_RENDER_PLAN_CACHE_SIZE", 2)
+    monkeypatch.setattr(T, "_render_plans", {})
+    fmt = T._table_formats["grid"]
+
+    def render(width):
+        return T._render_plan(fmt, [width % 50], ["left"]).build_row(["x"])
+
+    with ThreadPoolExecutor(8) as executor:
+        rows = list(executor.map(render, range(5000)))
+    assert_equal([render(width) for width in range(5000)], rows)
+    assert len(T._render_plans) <= 2
+
+
+def test_render_plan_escapes_cells():
+    "Internal: render plans escape the cells of the formats with escape maps"
+    fmt = T._table_formats["latex"]
+    plan = T._render_plan(fmt, [5], ["left"])
+    assert_equal(r" a\&b \\", plan.build_row(["a&b"]))
+
+
+def test_datarow_escaper():
+    "Internal: DataRow escape maps are compiled once and recompiled when changed"
+    row = T.DataRow("|", "|", "|", {"|": r"\|"})
+    escape = row._escaper()
+    assert row._escaper() is escape
+    assert_equal(r"a\|b", escape("a|b"))
+    row.escape_map["*"] = r"\*"
+    assert_equal(r"a\|b\*", row._escaper()("a|b*"))
@@ -1,10 +1,22 @@
 """Test output of the various forms of tabular data."""
 
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
+import io
+from itertools import count, islice
 
 from pytest import mark
 
-from tabulate import SEPARATING_LINE, simple_separated_format, tabulate
+import tabulate as tabulate_module
+from tabulate import (
+    SEPARATING_LINE,
+    Table,
+    paginate,
+    simple_separated_format,
+    tabulate,
+    tabulate_iter,
+    write_table,
+)
 
 from common import assert_equal, check_warnings, raises, skip
 
@@ -689,6 +701,28 @@ def test_grid_multiline_with_empty_cells_headerless():
     assert_equal(expected, result)
 
 
+def test_grid_multiline_with_blank_rows():
+    "Output: grid with multiline cells keeps rows whose cells are all empty"
+    table = [["a\nb", 1], ["", None], ["c", 2]]
+    expected = "\n".join(
+        [
+            "+-----+-----+",
+            "| h   |   n |",
+            "+=====+=====+",
+            "| a   |   1 |",
+            "| b   |     |",
+            "+-----+-----+",
+            "|     |     |",
+            "+-----+-----+",
+            "| c   |   2 |",
+            "+-----+-----+",
+        ]
+    )
+    assert_equal(expected, tabulate(table, ["h", "n"], tablefmt="grid"))
+    expected = "\n".join(["h      n", "---  ---", "a      1", "b", "", "c      2"])
+    assert_equal(expected, tabulate(table, ["h", "n"], tablefmt="simple"))
+
+
 def test_simple_grid():
     "Output: simple_grid with headers"
     expected = "\n".join(
@@ -3349,3 +3383,607 @@ def test_break_on_hyphens():
     expected = "h1    h2    h3\n----  ----  ----\nfoo-  bar-  foo-\nbar   bar   foo"
     result = tabulate(test_table, table_headers, maxcolwidths=5, break_on_hyphens=True)
     assert_equal(expected, result)
+
+
+def test_tabulate_iter_matches_tabulate():
+    "Output: tabulate_iter() yields the same lines as tabulate() produces"
+    for fmt in ["simple", "grid", "fancy_grid", "pipe", "html", "latex", "rst"]:
+        expected = tabulate(_test_table_with_sep_line, _test_table_headers, tablefmt=fmt)
+        result = "\n".join(
+            tabulate_iter(_test_table_with_sep_line, _test_table_headers, tablefmt=fmt)
+        )
+        assert_equal(expected, result)
+
+
+def test_tabulate_iter_multiline():
+    "Output: tabulate_iter() yields every line of a multiline row separately"
+    table = [["foo bar\nbaz", "hello"], ["", "multiline\nworld"]]
+    expected = tabulate(table, tablefmt="grid").split("\n")
+    result = list(tabulate_iter(table, tablefmt="grid"))
+    assert_equal(expected, result)
+
+
+def test_tabulate_iter_empty():
+    "Output: tabulate_iter() yields nothing for an empty table"
+    assert_equal([], list(tabulate_iter([])))
+
+
+def test_write_table():
+    "Output: write_table() writes the same table as print(tabulate()) does"
+    for fmt in ["simple", "grid", "html"]:
+        expected = tabulate(_test_table, _test_table_headers, tablefmt=fmt) + "\n"
+        buf = io.StringIO()
+        write_table(buf, _test_table, _test_table_headers, tablefmt=fmt)
+        assert_equal(expected, buf.getvalue())
+    buf = io.StringIO()
+    write_table(buf, [])
+    assert_equal("\n", buf.getvalue())
+
+
+def test_write_table_in_batches(monkeypatch):
+    "Output: write_table() writes lines in batches"
+    import tabulate as tabulate_module
+
+    class RecordingFile(io.StringIO):
+        def __init__(self):
+            super().__init__()
+            self.batches = []
+
+        def writelines(self, lines):
+            self.batches.append(list(lines))
+            super().writelines(self.batches[-1])
+
+    monkeypatch.setattr(tabulate_module, "_WRITE_BATCH_SIZE", 2)
+    table = [[i, i * i] for i in range(5)]
+    f = RecordingFile()
+    write_table(f, table, tablefmt="plain")
+    assert_equal([2, 2, 1], [len(b) for b in f.batches])
+    assert_equal(tabulate(table, tablefmt="plain") + "\n", f.getvalue())
+
+
+def test_tabulate_iter_sample_matches_tabulate():
+    "Output: tabulate_iter(sample=...) is the same as tabulate() if the sample covers all rows"
+    for fmt in ["simple", "grid", "pipe", "html", "rst"]:
+        for showindex in [False, True]:
+            expected = tabulate(
+                _test_table_with_sep_line,
+                _test_table_headers,
+                tablefmt=fmt,
+                showindex=showindex,
+            )
+            lines = tabulate_iter(
+                iter(_test_table_with_sep_line),
+                _test_table_headers,
+                tablefmt=fmt,
+                showindex=showindex,
+                sample=10,
+            )
+            assert_equal(expected, "\n".join(lines))
+
+
+def test_tabulate_iter_sample_infinite_rows():
+    "Output: tabulate_iter(sample=...) renders a table of an infinite iterator of rows"
+    rows = ([i, i / 4] for i in count())
+    lines = tabulate_iter(rows, ["n", "n/4"], tablefmt="psql", showindex=True, sample=2)
+    expected = [
+        "+----+-----+-------+",
+        "|    |   n |   n/4 |",
+        "|----+-----+-------|",
+        "|  0 |   0 |  0    |",
+        "|  1 |   1 |  0.25 |",
+        "|  2 |   2 |  0.5  |",
+        "|  3 |   3 |  0.75 |",
+    ]
+    assert_equal(expected, list(islice(lines, 7)))
+
+
+def test_tabulate_iter_sample_firstrow():
+    "Output: tabulate_iter(sample=...) reads headers='firstrow' in addition to the sample"
+    rows = iter([["name", "qty"], ["spam", 42], ["eggs", 451]])
+    expected = ["name      qty", "------  -----", "spam       42", "eggs      451"]
+    assert_equal(expected, list(tabulate_iter(rows, "firstrow", sample=1)))
+
+
+def test_tabulate_iter_sample_dicts():
+    "Output: tabulate_iter(sample=...) reads dicts after the sample in the order of the sample keys"
+    rows = iter([{"a": 1, "b": "x"}, {"b": "yy", "a": 2}, {"a": 3}])
+    expected = ["  a  b", "---  ---", "  1  x", "  2  yy", "  3"]
+    assert_equal(expected, list(tabulate_iter(rows, "keys", sample=1)))
+
+
+def test_tabulate_iter_colwidths_wrap():
+    "Output: tabulate_iter(colwidths=...) wraps long values in multiline formats"
+    rows = iter([["ab", 1], ["a very long value", 2]])
+    expected = [
+        "+--------+-----+",
+        "| k      |   v |",
+        "+========+=====+",
+        "| ab     |   1 |",
+        "+--------+-----+",
+        "| a very |   2 |",
+        "| long   |     |",
+        "| value  |     |",
+        "+--------+-----+",
+    ]
+    lines = tabulate_iter(rows, ["k", "v"], tablefmt="grid", sample=1, colwidths=[6])
+    assert_equal(expected, list(lines))
+
+
+def test_tabulate_iter_colwidths_truncate():
+    "Output: tabulate_iter(colwidths=...) truncates long values in single-line formats"
+    rows = iter([["ab", 1], ["a very long value", 2]])
+    expected = ["k     \t  v", "ab    \t  1", "a very\t  2"]
+    lines = tabulate_iter(rows, ["k", "v"], tablefmt="tsv", sample=1, colwidths=[6])
+    assert_equal(expected, list(lines))
+
+
+def test_tabulate_iter_colwidths_numbers():
+    "Output: tabulate_iter(colwidths=...) widens columns for the numbers of the sample"
+    rows = iter([[123456, "abcdef"], [1, "a"]])
+    expected = ["     n  t", "------  ---", "123456  abc", "        def", "     1  a"]
+    assert_equal(expected, list(tabulate_iter(rows, ["n", "t"], colwidths=[3, 3])))
+
+
+def test_tabulate_iter_sample_wide_numbers():
+    "Output: tabulate_iter(sample=...) lets numbers wider than their column overflow it"
+    rows = [["a", 1], ["b", 2], ["c", 123456789], ["d", 3.125]]
+    expected = [
+        "+-----+-----+",
+        "| h   |   n |",
+        "+=====+=====+",
+        "| a   |   1 |",
+        "+-----+-----+",
+        "| b   |   2 |",
+        "+-----+-----+",
+        "| c   | 123456789 |",
+        "+-----+-----+",
+        "| d   | 3.125 |",
+        "+-----+-----+",
+    ]
+    assert_equal(expected, list(tabulate_iter(iter(rows), ["h", "n"], "grid", sample=2)))
+    lines = list(tabulate_iter(iter(rows), ["h", "n"], "tsv", sample=2))
+    assert_equal(["c  \t123456789", "d  \t3.125"], lines[-2:])
+
+
+def test_tabulate_iter_sample_keeps_column_widths():
+    "Output: tabulate_iter(sample=...) wraps or truncates text wider than its column"
+    rows = [
+        [1.5, "ab", "x"],
+        [2.5, "long text which does not fit", "yz"],
+        [0.5, "\x1b[31mcolored text\x1b[0m", "中文中文中文"],
+        [None, "a\nmultiline\ncell", None],
+    ]
+    for tablefmt in ["grid", "psql", "fancy_grid", "pipe", "orgtbl"]:
+        lines = list(tabulate_iter(iter(rows), ["x", "y", "z"], tablefmt, sample=1))
+        widths = {tabulate_module._visible_width(line) for line in lines}
+        assert_equal(1, len(widths))
+
+
+def test_tabulate_iter_sample_invalid():
+    "Output: tabulate_iter(sample=0) raises ValueError"
+    with raises(ValueError):
+        list(tabulate_iter([[1]], sample=0))
+
+
+def test_write_table_sample():
+    "Output: write_table() accepts tabulate_iter() arguments"
+    f = io.StringIO()
+    write_table(f, iter([[1, 2], [3, 4]]), tablefmt="plain", sample=1)
+    assert_equal("1  2\n3  4\n", f.getvalue())
+
+
+def test_typeinfer_sample():
+    "Output: typeinfer='sample:N' deduces the same column types as typeinfer='full'"
+    table = [[i, str(i / 4), "x" if i == 37 else i, None if i % 7 else "1,000"] for i in range(50)]
+    expected = tabulate(table, floatfmt=".2f", intfmt=",")
+    for n in [1, 2, 10, 100]:
+        result = tabulate(table, floatfmt=".2f", intfmt=",", typeinfer=f"sample:{n}")
+        assert_equal(expected, result)
+
+
+def test_typeinfer_invalid():
+    "Output: typeinfer must be 'full' or 'sample:N'"
+    for typeinfer in ["sample", "sample:", "sample:x", "sample:0", "partial", None]:
+        with raises(ValueError):
+            tabulate([[1]], typeinfer=typeinfer)
+
+
+def test_max_rows():
+    "Output: max_rows shows the first and the last rows and an ellipsis row"
+    table = [[i, i / 4] for i in range(10)]
+    expected = "\n".join(
+        [
+            "  a       b",
+            "---  ------",
+            "  0    0",
+            "  1    0.25",
+            "...  ...",
+            "  9    2.25",
+        ]
+    )
+    result = tabulate(table, headers=["a", "b"], max_rows=3)
+    assert_equal(expected, result)
+    assert_equal(tabulate(table), tabulate(table, max_rows=10))
+    assert_equal(tabulate(iter(table), max_rows=3), tabulate(table, max_rows=3))
+
+
+def test_max_rows_separating_lines_and_showindex():
+    "Output: max_rows keeps separating lines between the shown rows and row indices"
+    table = [["a"], SEPARATING_LINE, ["b"], ["c"], ["d"], SEPARATING_LINE, ["e"], SEPARATING_LINE]
+    expected = "\n".join(
+        [
+            "---  ---",
+            "  0  a",
+            "---  ---",
+            "  1  b",
+            "...  ...",
+            "---  ---",
+            "  4  e",
+            "---  ---",
+            "---  ---",
+        ]
+    )
+    result = tabulate(table, max_rows=3, showindex=True)
+    assert_equal(expected, result)
+
+
+def test_max_rows_columns_and_firstrow():
+    "Output: max_rows elides rows of a dict of columns and keeps the first row as headers"
+    data = {"a": list(range(5)), "b": tuple("vwxyz")}
+    expected = "\n".join(["  0  v", "---  ---", "  1  w", "...  ...", "  4  z"])
+    result = tabulate(data, headers="firstrow", max_rows=2)
+    assert_equal(expected, result)
+
+
+def test_max_rows_numpy_and_pandas():
+    "Output: max_rows elides rows of NumPy arrays and keeps the index of a DataFrame"
+    try:
+        import numpy
+        import pandas
+
+        array = numpy.arange(10).reshape(5, 2)
+        expected = "\n".join(["---  ---", "  0    1", "...  ...", "  8    9", "---  ---"])
+        assert_equal(expected, tabulate(array, max_rows=2))
+        df = pandas.DataFrame({"x": range(5)}, index=list("abcde"))
+        expected = "\n".join(["       x", "---  ---", "a      0", "...  ...", "e      4"])
+        assert_equal(expected, tabulate(df, headers="keys", max_rows=2))
+    except ImportError:
+        skip("test_max_rows_numpy_and_pandas is skipped")
+
+
+def test_max_rows_elided_rows_not_formatted():
+    "Output: max_rows does not format the elided rows"
+
+    class Unformattable:
+        def __str__(self):
+            raise AssertionError("an elided value is formatted")
+
+    table = [[1, "a"]] + [[Unformattable(), Unformattable()]] * 5 + [[2, "b"]]
+    expected = "\n".join(["---  ---", "  1  a", "...  ...", "  2  b", "---  ---"])
+    assert_equal(expected, tabulate(table, max_rows=2))
+
+
+def test_max_rows_sequence_read_at_ends():
+    "Output: max_rows reads only the first and the last rows of a sequence"
+    read = []
+
+    class Rows(list):
+        def __getitem__(self, i):
+            read.append(i)
+            return list.__getitem__(self, i)
+
+        def __iter__(self):
+            raise AssertionError("all rows are read")
+
+    table = [[i, i * i] for i in range(1000)]
+    assert_equal(tabulate(iter(table), max_rows=4), tabulate(Rows(table), max_rows=4))
+    assert_equal(True, len(read) < 20)
+
+
+def test_max_rows_sequence_separating_lines():
+    "Output: max_rows counts the elided rows of a sequence without its separating lines"
+    table = [["a"], ["b"], SEPARATING_LINE, ["c"], SEPARATING_LINE, ["d"], ["e"], ["f"]]
+    rowalign = ["top", "bottom", "center", "top", "bottom", "center"]
+    for kwargs in [{"showindex": True}, {"tablefmt": "grid", "rowalign": rowalign}, {}]:
+        expected = tabulate(iter(table), max_rows=3, **kwargs)
+        assert_equal(expected, tabulate(table, max_rows=3, **kwargs))
+
+
+def test_max_rows_invalid():
+    "Output: max_rows must be a positive number of rows"
+    for max_rows in [0, -1, "2", 1.5]:
+        with raises(ValueError):
+            tabulate([[1, 2]], max_rows=max_rows)
+    with raises(ValueError):
+        list(tabulate_iter([[1, 2]], sample=1, max_rows=1))
+    with raises(ValueError):
+        Table([[1, 2]], max_rows=1)
+
+
+def test_workers_executor():
+    "Output: columns processed in an executor are the same as processed serially"
+    table = [
+        [i, f"\x1b[31m{i / 4}\x1b[0m", "中文" * (i % 3), None if i % 7 else "x"] for i in range(50)
+    ]
+    expected = tabulate(table, headers="keys", tablefmt="grid", floatfmt=".2f")
+    with ThreadPoolExecutor(2) as executor:
+        result = tabulate(table, headers="keys", tablefmt="grid", floatfmt=".2f", workers=executor)
+    assert_equal(expected, result)
+
+
+def test_workers_processes(monkeypatch):
+    "Output: columns processed in worker processes are the same as processed serially"
+    monkeypatch.setattr(tabulate_module, "_PARALLEL_MIN_CELLS", 0)
+    table = [[i, i / 4, "a\nb" if i == 3 else "c", "1,000"] for i in range(20)]
+    expected = tabulate(table, tablefmt="grid", intfmt=",")
+    assert_equal(expected, tabulate(table, tablefmt="grid", intfmt=",", workers=2))
+
+
+def test_workers_unpicklable_values(monkeypatch):
+    "Output: columns which cannot be sent to worker processes are processed serially"
+    monkeypatch.setattr(tabulate_module, "_PARALLEL_MIN_CELLS", 0)
+    table = [[1, lambda: None], [2, None]]
+    expected = tabulate(table)
+    assert_equal(expected, tabulate(table, workers=2))
+
+
+def test_workers_one_pool_per_table(monkeypatch):
+    "Output: the columns and the rows of a table are processed in the same pool"
+    monkeypatch.setattr(tabulate_module, "_PARALLEL_MIN_CELLS", 0)
+    monkeypatch.setattr(tabulate_module, "_RENDER_CHUNK_SIZE", 2)
+    pools = []
+
+    class CountedPool(ThreadPoolExecutor):
+        def __init__(self, workers):
+            super().__init__(workers)
+            pools.append(self)
+
+    monkeypatch.setattr(tabulate_module, "ProcessPoolExecutor", CountedPool)
+    table = [[i, "x" * i] for i in range(7)]
+    expected = tabulate(table, tablefmt="grid")
+    assert_equal(expected, tabulate(table, tablefmt="grid", workers=2))
+    assert_equal(1, len(pools))
+    assert_equal(True, pools[0]._shutdown)
+
+
+def test_workers_errors_are_raised(monkeypatch):
+    "Output: errors of the jobs done by workers are not hidden by a serial rerun"
+    monkeypatch.setattr(tabulate_module, "_PARALLEL_MIN_CELLS", 0)
+    calls = []
+
+    def broken_column(*args):
+        calls.append(args)
+        raise TypeError("not a pickling error")
+
+    monkeypatch.setattr(tabulate_module, "_type_and_format_column", broken_column)
+    with ThreadPoolExecutor(2) as executor:
+        with raises(TypeError):
+            tabulate([[1, 2]], workers=executor)
+    assert_equal(2, len(calls))
+
+
+def test_workers_threads_keep_settings(monkeypatch):
+    "Output: jobs done in threads do not change the settings of the module"
+    monkeypatch.setattr(tabulate_module, "WIDE_CHARS_MODE", False)
+    table = [["中文", i] for i in range(10)]
+    expected = tabulate(table, tablefmt="grid")
+    with ThreadPoolExecutor(2) as executor:
+        assert_equal(expected, tabulate(table, tablefmt="grid", workers=executor))
+    assert_equal(False, tabulate_module.WIDE_CHARS_MODE)
+
+
+def test_workers_invalid():
+    "Output: workers must be a positive int or an Executor"
+    for workers in [0, -1, "2", 1.5]:
+        with raises(ValueError):
+            tabulate([[1, 2]], workers=workers)
+
+
+def test_workers_render_row_chunks(monkeypatch):
+    "Output: rows rendered in chunks by workers are the same as rendered serially"
+    monkeypatch.setattr(tabulate_module, "_RENDER_CHUNK_SIZE", 3)
+    table = [[i, "a\nb" if i % 4 == 1 else "c|d"] for i in range(10)]
+    table[2:2] = [SEPARATING_LINE]
+    table[7:7] = [SEPARATING_LINE]
+    rowalign = ["top", "bottom", "center"] * 4
+    with ThreadPoolExecutor(2) as executor:
+        for fmt in ["grid", "simple", "github", "latex", "html"]:
+            for kwargs in [{}, {"rowalign": rowalign}]:
+                expected = tabulate(table, ["n", "h\ni"], fmt, **kwargs)
+                result = tabulate(table, ["n", "h\ni"], fmt, workers=executor, **kwargs)
+                assert_equal(expected, result)
+
+
+def test_workers_render_rows_in_processes(monkeypatch):
+    "Output: rows rendered in chunks by worker processes are the same as rendered serially"
+    monkeypatch.setattr(tabulate_module, "_PARALLEL_MIN_CELLS", 0)
+    monkeypatch.setattr(tabulate_module, "_RENDER_CHUNK_SIZE", 2)
+    table = [[i, "x" * i] for i in range(7)]
+    table[3:3] = [SEPARATING_LINE]
+    expected = tabulate(table, tablefmt="fancy_grid")
+    assert_equal(expected, tabulate(table, tablefmt="fancy_grid", workers=2))
+
+
+def _assert_table_matches_tabulate(batches, headers=(), tablefmt="simple", **options):
+    "Check that a Table is the same as tabulate() of its rows after every batch of rows."
+    table = Table(headers=headers, tablefmt=tablefmt, **options)
+    rows = []
+    for batch in batches:
+        table.append_rows(batch)
+        rows.extend(batch)
+        assert_equal(tabulate(rows, headers, tablefmt, **options), str(table))
+
+
+def test_table_append_rows():
+    "Output: Table is the same as tabulate() of all the rows appended so far"
+    batches = [
+        [["spam", 1], ["eggs", 22]],
+        [["spam", 3.5]],  # more digits after the decimal point
+        [["a longer name", 4]],  # a wider column
+        [["x", -1, "a new column"], ["y"]],
+        [],
+    ]
+    for fmt in ["simple", "grid", "github", "rst", "pretty", "latex", "html"]:
+        _assert_table_matches_tabulate(batches, ["name", "n"], fmt)
+        _assert_table_matches_tabulate(batches, "firstrow", fmt, showindex=True)
+        _assert_table_matches_tabulate(batches, tablefmt=fmt, floatfmt=".2f", numalign="left")
+
+
+def test_table_append_rows_multiline_and_colored():
+    "Output: Table handles multiline, colored and wrapped cells like tabulate()"
+    batches = [
+        [["one", 1]],
+        [["\x1b[31mred\x1b[0m", 2]],
+        [["two\nlines", 3], SEPARATING_LINE],
+        [["a rather long text value", 4.25]],
+    ]
+    for fmt in ["simple", "grid", "psql"]:
+        _assert_table_matches_tabulate(batches, ["text", "n"], fmt)
+        _assert_table_matches_tabulate(batches, ["text", "n"], fmt, rowalign="bottom")
+        _assert_table_matches_tabulate(batches, ["text", "n"], fmt, maxcolwidths=[6, None])
+
+
+def test_table_reuses_rows():
+    "Output: Table formats only the new rows if the columns do not change"
+    table = Table([[i, f"item {i}", i / 4] for i in range(100, 200)], ["n", "name", "x"], "grid")
+    str(table)
+    type_cache_before = tabulate_module.type_cache_info()
+    table.append_rows([[1, "item", 0.5]])
+    result = str(table)
+    type_cache_after = tabulate_module.type_cache_info()
+    # only the type of the new string is deduced (the type of numbers is not cached)
+    assert_equal(1, type_cache_after.misses - type_cache_before.misses)
+    assert_equal(0, type_cache_after.hits - type_cache_before.hits)
+    assert_equal(101, len(table))
+    expected = tabulate(
+        [[i, f"item {i}", i / 4] for i in range(100, 200)] + [[1, "item", 0.5]],
+        ["n", "name", "x"],
+        "grid",
+    )
+    assert_equal(expected, result)
+
+
+def test_table_dict_rows():
+    "Output: Table rows cannot be dicts"
+    with raises(TypeError):
+        Table([{"a": 1}])
+
+
+def _apply_table_diff(screen, diff):
+    "Update the lines of a table on a screen with a TableDiff."
+    if diff.full_redraw:
+        screen = []
+    screen = (screen + [None] * diff.nlines)[: diff.nlines]
+    for lineno, line in diff.lines:
+        screen[lineno] = line
+    return screen
+
+
+def test_table_showindex_iterator():
+    "Output: a Table reads an iterator of row indices once, as the rows are appended"
+    table = Table([["a", 1]], showindex=iter("xyz"))
+    assert_equal(tabulate([["a", 1]], showindex=["x"]), str(table))
+    table.append_rows([["b", 2]])
+    assert_equal(tabulate([["a", 1], ["b", 2]], showindex=["x", "y"]), str(table))
+    assert_equal(tabulate([["a", 1], ["b", 2]], showindex=["x", "y"]), str(table))
+    table = Table([["a", 1]], showindex=count(10))
+    table.append_rows([["b", 2]])
+    assert_equal(tabulate([["a", 1], ["b", 2]], showindex=[10, 11]), str(table))
+
+
+def test_table_update(monkeypatch):
+    "Output: Table.update() returns the changed lines of the table"
+    monkeypatch.setattr(tabulate_module, "_COLUMN_BLOCK_SIZE", 2)
+    rows = [["spam", 42], ["eggs", 451], SEPARATING_LINE, ["ham", 3.5], ["bacon", 1]]
+    updates = [
+        [["spam", 41], ["eggs", 451], SEPARATING_LINE, ["ham", 3.5], ["bacon", 1]],
+        [["spam", 41], ["eggs", 451], SEPARATING_LINE, ["ham", 3.5], ["bacon", 2], ["new", 1]],
+        [["spam", 41], ["eggs\nand ham", 45], SEPARATING_LINE, ["ham", 3.25], ["bacon", 2]],
+        [["spam", 41], SEPARATING_LINE, ["ham", 3.25], ["bacon", 2, "x"]],
+        [["spam", 41], ["ham", 3.25], ["bacon", 2]],
+        [],
+    ]
+    for fmt in ["psql", "grid", "simple", "html"]:
+        table = Table(rows, ["item", "qty"], fmt)
+        screen = _apply_table_diff([], table.diff())
+        for new_rows in updates:
+            screen = _apply_table_diff(screen, table.update(new_rows))
+            assert_equal(tabulate(new_rows, ["item", "qty"], fmt), "\n".join(screen))
+
+
+def test_table_update_changed_lines():
+    "Output: Table.update() returns only the lines of the changed rows if column widths are the same"
+    table = Table([["spam", 42], ["eggs", 451]], ["item", "qty"], "psql")
+    diff = table.diff()
+    assert_equal((6, True), (diff.nlines, diff.full_redraw))
+    diff = table.update([["spam", 41], ["eggs", 451]])
+    assert_equal(([(3, "| spam   |    41 |")], 6, False), tuple(diff))
+    diff = table.update([["spam", 41], ["eggs", 451]])
+    assert_equal(([], 6, False), tuple(diff))
+    diff = table.update([["spam", 123456], ["eggs", 451]])
+    assert_equal((6, True), (len(diff.lines), diff.full_redraw))
+
+
+def test_table_update_values_of_other_types():
+    "Output: Table.update() redraws rows whose values are equal but of other types"
+    table = Table([["a", 1], ["b", 2]])
+    table.diff()
+    diff = table.update([["a", True], ["b", 2]])
+    assert_equal(tabulate([["a", True], ["b", 2]]), str(table))
+    assert_equal(True, len(diff.lines) > 0)
+    table = Table([["a", 1], ["b", 2]], floatfmt=".2f")
+    table.diff()
+    table.update([["a", 1.0], ["b", 2]])
+    assert_equal(tabulate([["a", 1.0], ["b", 2]], floatfmt=".2f"), str(table))
+
+
+def test_table_update_multiline_lines():
+    "Output: Table.update() counts the lines of the output in multiline html and latex tables"
+    for fmt in ["html", "latex", "mediawiki"]:
+        table = Table([["spam\nand eggs", 42], ["ham", 451]], ["item", "qty"], fmt)
+        lines = str(table).split("\n")
+        assert_equal(len(lines), table.diff().nlines)
+        diff = table.update([["spam\nand eggs", 42], ["ham", 450]])
+        lines = str(table).split("\n")
+        assert_equal(len(lines), diff.nlines)
+        assert_equal(False, diff.full_redraw)
+        assert_equal(True, len(diff.lines) > 0)
+        for lineno, line in diff.lines:
+            assert_equal(lines[lineno], line)
+
+
+def test_paginate():
+    "Output: pages of a paginated table have the rows of the table and the same columns"
+    table = [[i, "x" * (i % 7), i / 3] for i in range(23)]
+    expected = tabulate(table, ["n", "text", "third"], "psql").split("\n")
+    header, rows, footer = expected[:3], expected[3:-1], expected[-1:]
+    pages = paginate(table, 10, ["n", "text", "third"], "psql")
+    assert_equal(3, len(pages))
+    for i, page in enumerate(pages):
+        assert_equal("\n".join(header + rows[i * 10 : i * 10 + 10] + footer), page)
+    assert_equal(pages[2], pages[-1])
+    assert_equal([pages[1], pages[2]], pages[1:])
+
+
+def test_paginate_separating_lines_and_multiline():
+    "Output: pages of a paginated table keep multiline rows and separating lines between them"
+    table = [["a", 1], SEPARATING_LINE, ["b\nc", 2], SEPARATING_LINE, ["d", 3], SEPARATING_LINE]
+    table += [["e", 4]]
+    pages = paginate(table, 2, ["text", "n"], "grid", rowalign="bottom")
+    expected_pages = [
+        [["a", 1], SEPARATING_LINE, ["b\nc", 2]],
+        [["d", 3], SEPARATING_LINE, ["e", 4]],
+    ]
+    for page, rows in zip(pages, expected_pages):
+        assert_equal(tabulate(rows, ["text", "n"], "grid", rowalign="bottom"), page)
+
+
+def test_paginate_empty():
+    "Output: a paginated table without rows has a page with headers only"
+    pages = paginate([], 10, ["a", "b"])
+    assert_equal(1, len(pages))
+    assert_equal(tabulate([], ["a", "b"]), pages[0])
+    with raises(IndexError):
+        pages[1]
+    with raises(ValueError):
+        paginate([], 0)
@@ -21,6 +21,36 @@ def test_ansi_color_in_table_cells():
     assert_equal(expected, formatted)
 
 
+def test_colored_column_does_not_change_other_columns():
+    "Regression: colorless columns are formatted the same in tables with a colored column"
+    table = [("1,234.5", "\x1b[31mfail\x1b[0m"), ("2", "ok")]
+    formatted = tabulate(table, tablefmt="plain")
+    colorless = tabulate([(a, "fail" if b != "ok" else b) for a, b in table], tablefmt="plain")
+    expected = ["1234.5  \x1b[31mfail\x1b[0m", "   2    ok"]
+    assert_equal(expected, formatted.splitlines())
+    assert_equal([line[:6] for line in colorless.splitlines()], [e[:6] for e in expected])
+
+
+def test_multiline_table_with_single_line_columns():
+    "Regression: single-line columns of a multiline table are aligned as before"
+    table = [["a\nbb", "x", 1.5], ["c", "\x1b[32myy\x1b[0m", 10]]
+    formatted = tabulate(table, ["h\n1", "h2", "h3"], tablefmt="grid")
+    expected = "\n".join(
+        [
+            "+-----+------+------+",
+            "| h   | h2   |   h3 |",
+            "| 1   |      |      |",
+            "+=====+======+======+",
+            "| a   | x    |  1.5 |",
+            "| bb  |      |      |",
+            "+-----+------+------+",
+            "| c   | \x1b[32myy\x1b[0m   | 10   |",
+            "+-----+------+------+",
+        ]
+    )
+    assert_equal(expected, formatted)
+
+
 def test_alignment_of_colored_cells():
     "Regression: Align ANSI-colored values as if they were colorless."
     colortable = [